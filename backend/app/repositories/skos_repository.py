@@ -4,6 +4,9 @@ Handles data persistence and retrieval for EURING versions and relationships
 """
 import json
 import os
+import stat
+import tempfile
+from collections import Counter
 from typing import List, Optional, Dict, Any
 from pathlib import Path
 from datetime import datetime
@@ -17,6 +20,12 @@ from ..models.euring_models import (
 )
 
 
+# Permission bits a newly created file gets; read once, since changing the umask
+# to query it is not thread-safe
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
 class SKOSRepository:
     """Repository for SKOS data persistence and retrieval"""
     
@@ -33,6 +42,10 @@ class SKOSRepository:
         
     async def save_version(self, version: EuringVersion) -> None:
         """Save an EURING version to storage"""
+        self.save_version_sync(version)
+    
+    def save_version_sync(self, version: EuringVersion) -> None:
+        """Save an EURING version to storage, blocking until the file is written and verified"""
         versions_dir = self.data_directory / "versions"
         versions_dir.mkdir(exist_ok=True)
         
@@ -112,20 +125,20 @@ class SKOSRepository:
         relationships_file = self.data_directory / "relationships.json"
         relationships_data = [rel.model_dump() for rel in relationships]
         
-        with open(relationships_file, 'w', encoding='utf-8') as f:
-            json.dump(relationships_data, f, indent=2, ensure_ascii=False)
+        # The full list now includes anything appended since the last save
+        self._replace_list(relationships_file, relationships_data)
+    
+    async def append_relationship(self, relationship: VersionRelationship) -> None:
+        """Persist one new relationship without rewriting the saved list"""
+        self._append_delta(self.data_directory / "relationships.json", relationship.model_dump())
     
     async def load_relationships(self) -> List[VersionRelationship]:
-        """Load version relationships from storage"""
+        """Load version relationships from storage, including any appended ones"""
         relationships_file = self.data_directory / "relationships.json"
         
-        if not relationships_file.exists():
-            return []
-            
         try:
-            with open(relationships_file, 'r', encoding='utf-8') as f:
-                relationships_data = json.load(f)
-                return [VersionRelationship(**rel_data) for rel_data in relationships_data]
+            relationships_data = self._read_list_with_delta(relationships_file)
+            return [VersionRelationship(**rel_data) for rel_data in relationships_data]
         except Exception as e:
             print(f"Error loading relationships: {e}")
             return []
@@ -135,24 +148,159 @@ class SKOSRepository:
         mappings_file = self.data_directory / "conversion_mappings.json"
         mappings_data = [mapping.model_dump() for mapping in mappings]
         
-        with open(mappings_file, 'w', encoding='utf-8') as f:
-            json.dump(mappings_data, f, indent=2, ensure_ascii=False, default=str)
+        # The full list now includes anything appended since the last save
+        self._replace_list(mappings_file, mappings_data)
+    
+    async def append_conversion_mapping(self, mapping: ConversionMapping) -> None:
+        """Persist one new conversion mapping without rewriting the saved list"""
+        self._append_delta(self.data_directory / "conversion_mappings.json", mapping.model_dump())
     
     async def load_conversion_mappings(self) -> List[ConversionMapping]:
-        """Load conversion mappings from storage"""
+        """Load conversion mappings from storage, including any appended ones"""
         mappings_file = self.data_directory / "conversion_mappings.json"
         
-        if not mappings_file.exists():
-            return []
-            
         try:
-            with open(mappings_file, 'r', encoding='utf-8') as f:
-                mappings_data = json.load(f)
-                return [ConversionMapping(**mapping_data) for mapping_data in mappings_data]
+            mappings_data = self._read_list_with_delta(mappings_file)
+            return [ConversionMapping(**mapping_data) for mapping_data in mappings_data]
         except Exception as e:
             print(f"Error loading conversion mappings: {e}")
             return []
     
+    async def compact(self) -> None:
+        """Fold appended relationships and conversion mappings into their saved lists"""
+        for list_file in (self.data_directory / "relationships.json",
+                          self.data_directory / "conversion_mappings.json"):
+            if self._delta_file(list_file).exists():
+                self._compact_list(list_file)
+    
+    # Appended records live in a "<list>.delta.jsonl" file next to the saved list.
+    # Its first line stamps the saved list it extends (inode, size, mtime). Any
+    # rewrite of the list goes through os.replace, which changes the stamp, so a
+    # delta that was already folded into the list stops applying in that same
+    # step, even if removing the delta file afterwards never happens. Reading
+    # never writes; appending compacts once the delta grows past
+    # delta_compact_bytes, or when it finds the delta stale.
+    
+    delta_compact_bytes = 256 * 1024
+    
+    @staticmethod
+    def _delta_file(list_file: Path) -> Path:
+        """Append-only companion of a saved list, holding one JSON record per line"""
+        return list_file.with_suffix(".delta.jsonl")
+    
+    @staticmethod
+    def _list_stamp(list_file: Path) -> str:
+        """Identifies one written state of a saved list"""
+        try:
+            file_stat = list_file.stat()
+        except FileNotFoundError:
+            return "missing"
+        return f"{file_stat.st_ino}:{file_stat.st_size}:{file_stat.st_mtime_ns}"
+    
+    @staticmethod
+    def _record_key(record: Dict[str, Any]) -> str:
+        return json.dumps(record, sort_keys=True, ensure_ascii=False, default=str)
+    
+    def _read_delta_header(self, delta_file: Path) -> Optional[str]:
+        """Stamp of the saved list a delta file extends, if it has one"""
+        try:
+            with open(delta_file, 'r', encoding='utf-8') as f:
+                return json.loads(f.readline()).get("extends")
+        except (FileNotFoundError, ValueError, AttributeError):
+            return None
+    
+    def _append_delta(self, list_file: Path, record: Dict[str, Any]) -> None:
+        """Append one record to a list's delta file, compacting it first if it is stale"""
+        delta_file = self._delta_file(list_file)
+        if delta_file.exists() and self._read_delta_header(delta_file) != self._list_stamp(list_file):
+            # Fold what the stale delta still adds before starting a new one
+            self._compact_list(list_file)
+        
+        with open(delta_file, 'a', encoding='utf-8') as f:
+            if f.tell() == 0:
+                f.write(json.dumps({"extends": self._list_stamp(list_file)}) + "\n")
+            f.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+            size = f.tell()
+        
+        if size > self.delta_compact_bytes:
+            self._compact_list(list_file)
+    
+    def _load_delta(self, list_file: Path, base: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Records appended to a list since it was last written in full"""
+        delta_file = self._delta_file(list_file)
+        if not delta_file.exists():
+            return []
+        
+        records = []
+        header = None
+        with open(delta_file, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    # A write interrupted mid-line only loses that record
+                    print(f"Error loading {delta_file.name} line {line_number}: {e}")
+                    continue
+                if line_number == 1 and isinstance(record, dict) and record.keys() == {"extends"}:
+                    header = record["extends"]
+                else:
+                    records.append(record)
+        
+        if records and header != self._list_stamp(list_file):
+            # The list was rewritten after this delta was started: either a
+            # full save that stopped before removing it, or an edit in place.
+            # Keep only the records the list does not already hold.
+            remaining = Counter(self._record_key(record) for record in base)
+            missing = []
+            for record in records:
+                key = self._record_key(record)
+                if remaining[key]:
+                    remaining[key] -= 1
+                else:
+                    missing.append(record)
+            if missing:
+                print(f"{list_file.name} changed after {delta_file.name} was started; "
+                      f"keeping {len(missing)} appended records it does not contain")
+            records = missing
+        return records
+    
+    def _read_list_with_delta(self, list_file: Path) -> List[Dict[str, Any]]:
+        """Saved list followed by the records appended to it"""
+        records = []
+        if list_file.exists():
+            with open(list_file, 'r', encoding='utf-8') as f:
+                records = json.load(f)
+        return records + self._load_delta(list_file, records)
+    
+    def _compact_list(self, list_file: Path) -> None:
+        """Rewrite a saved list with its delta folded in"""
+        self._replace_list(list_file, self._read_list_with_delta(list_file))
+    
+    def _replace_list(self, list_file: Path, records: List[Dict[str, Any]]) -> None:
+        """Atomically rewrite a saved list in full, retiring its delta file"""
+        fd, temp_path = tempfile.mkstemp(dir=list_file.parent, prefix=f".{list_file.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(records, f, indent=2, ensure_ascii=False, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            # mkstemp creates the file owner-only; keep the permissions the list had
+            # (or would get from a plain open) so other service users can still read it
+            try:
+                mode = stat.S_IMODE(list_file.stat().st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            os.chmod(temp_path, mode)
+            os.replace(temp_path, list_file)
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        
+        # The replace above already made the delta stale; this is cleanup
+        self._delta_file(list_file).unlink(missing_ok=True)
+    
     async def version_exists(self, version_id: str) -> bool:
         """Check if a version exists in storage"""
         version_file = self.data_directory / "versions" / f"{version_id}.json"
@@ -262,10 +262,10 @@ class DomainEvolutionAnalyzer:
             semantic_meanings.append({
                 "field_name": meaning.field_name,
                 "primary_concept": meaning.primary_concept,
-                "secondary_concepts": meaning.secondary_concepts,
+                "secondary_concepts": list(meaning.secondary_concepts),
                 "semantic_category": meaning.semantic_category,
                 "confidence": meaning.confidence,
-                "linguistic_patterns": meaning.linguistic_patterns
+                "linguistic_patterns": list(meaning.linguistic_patterns)
             })
         
         # Format field groups for output
@@ -0,0 +1,135 @@
+"""
+Pattern Trie
+Aho-Corasick automaton shared by the semantic services for matching literal
+patterns against field names and descriptions
+"""
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+
+class _TrieNode:
+    """State of an Aho-Corasick automaton over literal byte patterns"""
+    __slots__ = ('children', 'fail', 'hits', 'name_hits')
+    
+    def __init__(self):
+        self.children: Dict[int, '_TrieNode'] = {}  # keyed by byte value
+        self.fail: Optional['_TrieNode'] = None
+        # Entries whose pattern ends at this state, including those reached via
+        # failure links once the automaton is built
+        self.hits: List[int] = []       # valid anywhere in the text
+        self.name_hits: List[int] = []  # valid only inside the leading name
+
+
+class PatternTrie:
+    """
+    Aho-Corasick matcher over UTF-8 encoded, lowercased field text (UTF-8 keeps
+    substring matches identical to str). Field-name patterns and semantic-meaning
+    patterns share one automaton, so a single left-to-right scan of the combined
+    text finds both; name patterns only count while the match lies inside the
+    leading field name.
+    
+    A compiled re alternation of the same patterns is not a substitute: SRE
+    tries the alternatives one by one at every offset (several times slower
+    than this table walk on field descriptions, even with no match), and it
+    reports only one pattern per start offset. Nor is a generated function of
+    straight-line `pattern in text` tests: with ~190 patterns it is about 2.5x
+    slower than the walk on the shipped field definitions.
+    """
+    
+    def __init__(self):
+        self.root = _TrieNode()
+    
+    def add(self, pattern: bytes, entry_id: int, name_only: bool = False):
+        node = self.root
+        for byte in pattern:
+            child = node.children.get(byte)
+            if child is None:
+                child = node.children[byte] = _TrieNode()
+            node = child
+        (node.name_hits if name_only else node.hits).append(entry_id)
+    
+    def build(self):
+        """
+        Compute failure links breadth-first, then compile the automaton into a
+        dense transition table so scanning needs no failure-link chasing
+        """
+        root = self.root
+        root.fail = root
+        order = [root]
+        queue = deque()
+        for child in root.children.values():
+            child.fail = root
+            queue.append(child)
+        
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for byte, child in node.children.items():
+                # Longest proper suffix of child's path that is also a trie path
+                fallback = node.fail
+                while fallback is not root and byte not in fallback.children:
+                    fallback = fallback.fail
+                child.fail = fallback.children.get(byte, root)
+                if child.fail is child:
+                    child.fail = root
+                child.hits = child.hits + child.fail.hits
+                child.name_hits = child.name_hits + child.fail.name_hits
+                queue.append(child)
+        
+        # Bytes that occur in no pattern share class 0, which always returns to
+        # the root; text is mapped to classes with one bytes.translate call
+        alphabet = sorted({byte for node in order for byte in node.children})
+        width = len(alphabet) + 1
+        class_table = bytearray(256)
+        for byte_class, byte in enumerate(alphabet, 1):
+            class_table[byte] = byte_class
+        self._byte_classes = bytes(class_table)
+        
+        # States are addressed by row offset (state number * width) so the scan
+        # loop is a single list index per byte
+        offsets = {id(node): i * width for i, node in enumerate(order)}
+        delta = [0] * (len(order) * width)
+        hits: List[Optional[Tuple[int, ...]]] = [None] * len(delta)
+        name_hits: List[Optional[Tuple[int, ...]]] = [None] * len(delta)
+        for node in order:
+            row = offsets[id(node)]
+            fail_row = offsets[id(node.fail)]
+            for byte_class, byte in enumerate(alphabet, 1):
+                child = node.children.get(byte)
+                if child is not None:
+                    delta[row + byte_class] = offsets[id(child)]
+                elif node is not root:
+                    # BFS order guarantees the failure state's row is complete
+                    delta[row + byte_class] = delta[fail_row + byte_class]
+            hits[row] = tuple(node.hits) or None
+            name_hits[row] = tuple(node.hits + node.name_hits) or None
+        self._delta = delta
+        self._hits = hits
+        self._name_hits = name_hits
+    
+    def scan_name(self, name: bytes, matched: Set[int]) -> int:
+        """Scan the leading field name into matched and return the automaton state"""
+        delta = self._delta
+        name_hits = self._name_hits
+        state = 0
+        for byte_class in name.translate(self._byte_classes):
+            state = delta[state + byte_class]
+            if name_hits[state]:
+                matched.update(name_hits[state])
+        return state
+    
+    def scan(self, state: int, chunks: Tuple[bytes, ...], matched: Set[int]) -> int:
+        """
+        Continue scanning from state over chunks, collecting only patterns valid
+        outside the name. The state carries over between chunks, so matches that
+        span them are found without building the joined text.
+        """
+        delta = self._delta
+        byte_classes = self._byte_classes
+        hits = self._hits
+        for chunk in chunks:
+            for byte_class in chunk.translate(byte_classes):
+                state = delta[state + byte_class]
+                if hits[state]:
+                    matched.update(hits[state])
+        return state
@@ -1,8 +1,11 @@
 """
 Recognition Engine implementation for EURING Code Recognition System
 """
+import asyncio
+import pickle
 import re
 import time
+from collections import Counter
 from typing import List, Optional, Dict, Any, Tuple
 from ..models.euring_models import (
     RecognitionResult, BatchRecognitionResult, EuringVersion, 
@@ -12,31 +15,68 @@ from .interfaces import RecognitionEngine, SKOSManager
 from .skos_manager import SKOSManagerImpl
 
 
+# Format discriminant feature bits (see PatternMatcher._extract_discriminant_features)
+_HAS_PIPE = 1 << 0
+_HAS_DOUBLE_DASH = 1 << 1
+_STARTS_WITH_DIGITS = 1 << 2
+_STARTS_WITH_LETTER = 1 << 3
+_NO_SPACES = 1 << 4
+_AT_MOST_ONE_SPACE = 1 << 5
+_MANY_SPACES = 1 << 6
+_LENGTH_1979 = 1 << 7
+_LENGTH_2000 = 1 << 8
+
+# (mask, required bits) per version discriminant
+_MASK_1966 = _MANY_SPACES | _HAS_PIPE | _HAS_DOUBLE_DASH
+_REQUIRED_1979 = _LENGTH_1979 | _STARTS_WITH_DIGITS | _HAS_DOUBLE_DASH | _AT_MOST_ONE_SPACE
+_MASK_1979 = _REQUIRED_1979 | _HAS_PIPE
+_REQUIRED_2000 = _LENGTH_2000 | _NO_SPACES | _STARTS_WITH_LETTER
+_MASK_2000 = _REQUIRED_2000 | _HAS_PIPE
+
+
+def _all_same_version(results: List[RecognitionResult]) -> bool:
+    """True when every result has the same detected version; stops at the first mismatch"""
+    if not results:
+        return False
+    first = results[0].detected_version.id
+    return all(result.detected_version.id == first for result in results)
+
+
 class PatternMatcher:
     """Core pattern matching algorithms for EURING version detection"""
     
-    def __init__(self):
+    def __init__(self, record_timings: bool = True):
         self.confidence_weights = {
             'total_length': 0.3,
             'field_pattern': 0.4,
             'validation_rules': 0.2,
             'regex_match': 0.1
         }
+        # Per-call timing costs more than the short-circuit path it measures;
+        # pass record_timings=False when processing_time_ms is not needed (it is
+        # then reported as 0.0)
+        self.record_timings = record_timings
+        # (version id, field name) -> (field_def, frozenset of its valid values);
+        # an entry only applies to the definition it was built from, so a reloaded
+        # version replaces its entries instead of adding new ones
+        self._valid_values_sets: Dict[Tuple[str, str], Tuple[Any, frozenset]] = {}
     
     def calculate_match_score(
         self, 
         euring_string: str, 
-        version: EuringVersion
+        version: EuringVersion,
+        discriminant_score: Optional[float] = None
     ) -> Tuple[float, Dict[str, Any]]:
         """Calculate match score between string and version"""
-        start_time = time.time()
+        start_ns = time.perf_counter_ns() if self.record_timings else 0
         
         # Initialize scoring components
         scores = {}
         field_matches = {}
         
-        # Quick discriminant checks for high accuracy
-        discriminant_score = self._check_format_discriminants(euring_string, version)
+        # Quick discriminant checks for high accuracy (may be precomputed by batch callers)
+        if discriminant_score is None:
+            discriminant_score = self._check_format_discriminants(euring_string, version)
         scores['format_discriminant'] = discriminant_score
         
         # If discriminant fails badly, heavily penalize
@@ -80,7 +120,7 @@ class PatternMatcher:
             for component in scores
         )
         
-        processing_time = (time.time() - start_time) * 1000
+        processing_time = (time.perf_counter_ns() - start_ns) / 1e6 if self.record_timings else 0.0
         
         analysis_details = {
             'processing_time_ms': processing_time,
@@ -91,48 +131,72 @@ class PatternMatcher:
         
         return total_score, analysis_details
     
+    def score_discriminants_batch(
+        self,
+        strings: List[str],
+        versions: List[EuringVersion]
+    ) -> List[List[float]]:
+        """Compute the (strings x versions) discriminant score matrix, one table lookup per string"""
+        version_ids = [version.id for version in versions]
+        score_table: Dict[int, List[float]] = {}
+        matrix = []
+        for euring_string in strings:
+            features = self._extract_discriminant_features(euring_string)
+            row = score_table.get(features)
+            if row is None:
+                row = [self._score_discriminant_features(features, version_id) for version_id in version_ids]
+                score_table[features] = row
+            matrix.append(row)
+        return matrix
+    
     def _check_format_discriminants(self, euring_string: str, version: EuringVersion) -> float:
         """Check format-specific discriminants for high accuracy recognition"""
-        version_id = version.id
-        
+        features = self._extract_discriminant_features(euring_string)
+        return self._score_discriminant_features(features, version.id)
+    
+    def _extract_discriminant_features(self, euring_string: str) -> int:
+        """Scan a string once and pack every feature the format discriminants look at into a bitmap"""
+        length = len(euring_string)
+        space_count = euring_string.count(" ")
+        
+        features = 0
+        if "|" in euring_string:
+            features |= _HAS_PIPE
+        if "--" in euring_string:
+            features |= _HAS_DOUBLE_DASH
+        if euring_string[:5].isdigit():
+            features |= _STARTS_WITH_DIGITS
+        if euring_string[:1].isalpha():
+            features |= _STARTS_WITH_LETTER
+        if space_count == 0:
+            features |= _NO_SPACES
+        if space_count <= 1:
+            features |= _AT_MOST_ONE_SPACE
+        if space_count >= 5:
+            features |= _MANY_SPACES
+        if 75 <= length <= 82:
+            features |= _LENGTH_1979
+        if 90 <= length <= 100:
+            features |= _LENGTH_2000
+        return features
+    
+    def _score_discriminant_features(self, features: int, version_id: str) -> float:
+        """Score a feature bitmap against a version's format discriminants"""
         # 2020: Must contain pipe separators
         if version_id == "euring_2020":
-            if "|" in euring_string:
-                return 1.0
-            else:
-                return 0.0
+            return 1.0 if features & _HAS_PIPE else 0.0
         
         # 1966: Must contain multiple spaces (space-separated format), no pipes, no "--"
         elif version_id == "euring_1966":
-            space_count = euring_string.count(" ")
-            if (space_count >= 5 and 
-                "|" not in euring_string and
-                "--" not in euring_string):
-                return 1.0
-            else:
-                return 0.0
+            return 1.0 if features & _MASK_1966 == _MANY_SPACES else 0.0
         
-        # 1979: Fixed length ~78, no pipes, starts with digits, contains "--", minimal spaces
+        # 1979: Fixed length ~78, no pipes, starts with digits, contains "--", max 1 space
         elif version_id == "euring_1979":
-            space_count = euring_string.count(" ")
-            if (75 <= len(euring_string) <= 82 and 
-                "|" not in euring_string and
-                euring_string[:5].isdigit() and
-                "--" in euring_string and
-                space_count <= 1):  # Allow max 1 space
-                return 1.0
-            else:
-                return 0.0
+            return 1.0 if features & _MASK_1979 == _REQUIRED_1979 else 0.0
         
         # 2000: Fixed length ~96, no spaces, no pipes, starts with letters
         elif version_id == "euring_2000":
-            if (90 <= len(euring_string) <= 100 and 
-                " " not in euring_string and 
-                "|" not in euring_string and
-                euring_string[0].isalpha()):
-                return 1.0
-            else:
-                return 0.0
+            return 1.0 if features & _MASK_2000 == _REQUIRED_2000 else 0.0
         
         # Default fallback
         return 0.5
@@ -158,7 +222,7 @@ class PatternMatcher:
                 field_value = euring_string[current_position:current_position + field_length]
                 
                 # Check if field matches expected pattern
-                field_match = self._validate_field_value(field_value, field_def)
+                field_match = self._validate_field_value(field_value, field_def, version.id)
                 field_matches[field_name] = field_match
                 
                 if field_match:
@@ -171,7 +235,7 @@ class PatternMatcher:
         field_score = matched_fields / total_fields if total_fields > 0 else 0.0
         return field_score, field_matches
     
-    def _validate_field_value(self, value: str, field_def) -> bool:
+    def _validate_field_value(self, value: str, field_def, version_id: str) -> bool:
         """Validate a field value against its definition"""
         # Check length
         if len(value) != field_def.length:
@@ -179,7 +243,7 @@ class PatternMatcher:
         
         # Check valid values if specified
         if field_def.valid_values:
-            return value in field_def.valid_values
+            return value in self._get_valid_values_set(field_def, version_id)
         
         # Check data type constraints
         if field_def.data_type == "string":
@@ -193,6 +257,19 @@ class PatternMatcher:
         
         return True
     
+    def _get_valid_values_set(self, field_def, version_id: str) -> frozenset:
+        """Return the field's valid values as a frozenset, built once per field definition"""
+        key = (version_id, field_def.name)
+        entry = self._valid_values_sets.get(key)
+        if entry is None or entry[0] is not field_def:
+            entry = (field_def, frozenset(field_def.valid_values))
+            self._valid_values_sets[key] = entry
+        return entry[1]
+    
+    def clear_valid_values_cache(self) -> None:
+        """Forget the valid value sets of previously scored versions"""
+        self._valid_values_sets.clear()
+    
     def _check_validation_rules(self, euring_string: str, version: EuringVersion) -> float:
         """Check validation rules against the string"""
         if not version.validation_rules:
@@ -278,16 +355,32 @@ class ContextAnalyzer:
             2024: 1.0   # Recent versions more likely
         }
     
+    def temporal_weight(self, version: EuringVersion) -> float:
+        """Temporal context score of one candidate, preferring more recent versions"""
+        return self.historical_weights.get(version.year, 0.5)
+    
+    def field_consistency(self, analysis: Dict[str, Any]) -> float:
+        """Share of fields that matched in one candidate's analysis"""
+        field_matches = analysis.get('field_matches', {})
+        total_fields = len(field_matches)
+        if total_fields == 0:
+            return 0.0
+        return sum(1 for match in field_matches.values() if match) / total_fields
+    
+    def format_likelihood(self, string_length: int, version: EuringVersion) -> float:
+        """Length-based likelihood that a string of this length is in the version's format"""
+        expected_length = version.format_specification.total_length
+        
+        # Perfect length match gets highest score
+        if string_length == expected_length:
+            return 1.0
+        # Penalize length mismatches
+        length_diff = abs(string_length - expected_length)
+        return max(0.0, 1.0 - (length_diff / expected_length))
+    
     def analyze_temporal_context(self, candidates: List[Tuple[EuringVersion, float, Dict[str, Any]]]) -> Dict[str, float]:
         """Analyze temporal context to prefer more recent versions"""
-        context_scores = {}
-        
-        for version, score, _ in candidates:
-            # Apply temporal weighting
-            temporal_weight = self.historical_weights.get(version.year, 0.5)
-            context_scores[version.id] = temporal_weight
-        
-        return context_scores
+        return {version.id: self.temporal_weight(version) for version, _, _ in candidates}
     
     def analyze_field_consistency(
         self, 
@@ -295,19 +388,7 @@ class ContextAnalyzer:
         candidates: List[Tuple[EuringVersion, float, Dict[str, Any]]]
     ) -> Dict[str, float]:
         """Analyze field consistency for disambiguation"""
-        consistency_scores = {}
-        
-        for version, score, analysis in candidates:
-            field_matches = analysis.get('field_matches', {})
-            
-            # Calculate consistency based on field match patterns
-            total_fields = len(field_matches)
-            matched_fields = sum(1 for match in field_matches.values() if match)
-            
-            consistency_score = matched_fields / total_fields if total_fields > 0 else 0.0
-            consistency_scores[version.id] = consistency_score
-        
-        return consistency_scores
+        return {version.id: self.field_consistency(analysis) for version, _, analysis in candidates}
     
     def analyze_format_likelihood(
         self, 
@@ -315,22 +396,11 @@ class ContextAnalyzer:
         candidates: List[Tuple[EuringVersion, float, Dict[str, Any]]]
     ) -> Dict[str, float]:
         """Analyze format likelihood based on string characteristics"""
-        likelihood_scores = {}
-        
         string_length = len(euring_string)
-        
-        for version, score, _ in candidates:
-            expected_length = version.format_specification.total_length
-            
-            # Perfect length match gets highest score
-            if string_length == expected_length:
-                likelihood_scores[version.id] = 1.0
-            else:
-                # Penalize length mismatches
-                length_diff = abs(string_length - expected_length)
-                likelihood_scores[version.id] = max(0.0, 1.0 - (length_diff / expected_length))
-        
-        return likelihood_scores
+        return {
+            version.id: self.format_likelihood(string_length, version)
+            for version, _, _ in candidates
+        }
 
 
 class UncertaintyHandler:
@@ -462,20 +532,15 @@ class AmbiguityResolver:
     ) -> Tuple[EuringVersion, float, Dict[str, Any]]:
         """Apply enhanced context-based disambiguation algorithms"""
         
-        # Get context scores
-        temporal_scores = self.context_analyzer.analyze_temporal_context(candidates)
-        consistency_scores = self.context_analyzer.analyze_field_consistency(euring_string, candidates)
-        likelihood_scores = self.context_analyzer.analyze_format_likelihood(euring_string, candidates)
+        # Single pass: score every context factor per candidate and track the best one
+        context_analyzer = self.context_analyzer
+        string_length = len(euring_string)
+        best_enhanced = None
         
-        # Calculate weighted combined scores
-        enhanced_candidates = []
         for version, original_score, analysis in candidates:
-            version_id = version.id
-            
-            # Combine different context factors
-            temporal_weight = temporal_scores.get(version_id, 0.5)
-            consistency_weight = consistency_scores.get(version_id, 0.5)
-            likelihood_weight = likelihood_scores.get(version_id, 0.5)
+            temporal_weight = context_analyzer.temporal_weight(version)
+            consistency_weight = context_analyzer.field_consistency(analysis)
+            likelihood_weight = context_analyzer.format_likelihood(string_length, version)
             
             # Weighted combination
             enhanced_score = (
@@ -493,11 +558,11 @@ class AmbiguityResolver:
                 'enhanced_score': enhanced_score
             }
             
-            enhanced_candidates.append((version, enhanced_score, analysis))
+            if best_enhanced is None or enhanced_score > best_enhanced[1]:
+                best_enhanced = (version, enhanced_score, analysis)
         
         # Return best enhanced candidate
-        best_enhanced = max(enhanced_candidates, key=lambda x: x[1])
-        return best_enhanced[0], best_enhanced[1], best_enhanced[2]
+        return best_enhanced
     
     def generate_uncertainty_options(
         self, 
@@ -544,9 +609,9 @@ class BatchProcessor:
                 string, best_version
             )
             
-            analysis_metadata = AnalysisMetadata(**analysis)
+            analysis_metadata = AnalysisMetadata.model_construct(**analysis)
             
-            result = RecognitionResult(
+            result = RecognitionResult.model_construct(
                 detected_version=best_version,
                 confidence=score,
                 alternative_versions=None,
@@ -584,12 +649,17 @@ class BatchProcessor:
                 # If no compatible versions, use all versions but with lower confidence
                 compatible_versions = versions
             
+            # Score format discriminants for the whole group up front
+            discriminant_matrix = self.pattern_matcher.score_discriminants_batch(
+                [string for _, string in string_group], compatible_versions
+            )
+            
             # Process strings in this group
-            for original_index, string in string_group:
+            for (original_index, string), discriminant_row in zip(string_group, discriminant_matrix):
                 candidates = []
-                for version in compatible_versions:
+                for version, discriminant_score in zip(compatible_versions, discriminant_row):
                     score, analysis = self.pattern_matcher.calculate_match_score(
-                        string, version
+                        string, version, discriminant_score
                     )
                     candidates.append((version, score, analysis))
                 
@@ -598,9 +668,9 @@ class BatchProcessor:
                     self.ambiguity_resolver.resolve_ambiguity(candidates)
                 )
                 
-                analysis_metadata = AnalysisMetadata(**analysis_details)
+                analysis_metadata = AnalysisMetadata.model_construct(**analysis_details)
                 
-                result = RecognitionResult(
+                result = RecognitionResult.model_construct(
                     detected_version=best_version,
                     confidence=confidence,
                     alternative_versions=alternatives if alternatives else None,
@@ -636,6 +706,66 @@ class BatchProcessor:
         return organized
 
 
+class _SingleCallBatcher:
+    """Coalesces concurrent single-string submissions into one batch call"""
+    
+    def __init__(self, process_batch, max_batch_size: int = 64, max_wait_ms: float = 10):
+        self._process_batch = process_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        # The event loop only keeps weak references to tasks; hold in-flight
+        # batch runs here so they cannot be collected before resolving callers
+        self._tasks: set = set()
+    
+    async def submit(self, item: str) -> Any:
+        """Queue an item and wait for its result from the next batch"""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((item, future))
+        
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        
+        return await future
+    
+    def _flush(self):
+        """Hand the pending items to a batch run"""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        
+        pending, self._pending = self._pending, []
+        if pending:
+            task = asyncio.ensure_future(self._run(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+    
+    async def _run(self, pending: List[Tuple[str, asyncio.Future]]):
+        """Process one batch and resolve each caller's future in submission order"""
+        try:
+            results = await self._process_batch([item for item, _ in pending])
+            if len(results) != len(pending):
+                raise RuntimeError(
+                    f"Batch returned {len(results)} results for {len(pending)} requests"
+                )
+            for (_, future), result in zip(pending, results):
+                if not future.done():
+                    future.set_result(result)
+        except Exception as e:
+            for _, future in pending:
+                if not future.done():
+                    future.set_exception(e)
+        finally:
+            # Cancelled (or failed with a non-Exception): no caller may be left waiting
+            for _, future in pending:
+                if not future.done():
+                    future.cancel()
+
+
 class RecognitionEngineImpl(RecognitionEngine):
     """Concrete implementation of Recognition Engine"""
     
@@ -645,6 +775,18 @@ class RecognitionEngineImpl(RecognitionEngine):
         self.ambiguity_resolver = AmbiguityResolver()
         self.batch_processor = BatchProcessor(self.pattern_matcher, self.ambiguity_resolver)
         self._versions_cache: Optional[List[EuringVersion]] = None
+        # (versions list, id -> pickled version.dict()) for uncertainty options;
+        # each caller unpickles its own copy, which is cheaper than re-serializing
+        self._version_dicts: Optional[Tuple[List[EuringVersion], Dict[str, bytes]]] = None
+        # A best score at or above the threshold, ahead of the runner-up by at least
+        # the gap, is unambiguous: skip ambiguity resolution entirely
+        self.fast_path_threshold = 0.9
+        self.fast_path_gap = 0.3
+        # Upper bound on concurrent recognize_version calls for small batches
+        self.max_concurrent_recognitions = 32
+        # Opt-in: merge concurrent recognize_version calls into mixed-version batches
+        self.enable_coalescing = False
+        self._batcher = _SingleCallBatcher(self._process_coalesced_batch)
     
     async def recognize_version(self, euring_string: str) -> RecognitionResult:
         """Recognize the EURING version of a single string"""
@@ -656,29 +798,57 @@ class RecognitionEngineImpl(RecognitionEngine):
             version_model = await self.skos_manager.load_version_model()
             self._versions_cache = version_model.versions
         
-        # Calculate match scores for all versions
+        if self.enable_coalescing:
+            return await self._batcher.submit(euring_string)
+        
+        # Calculate match scores for all versions, tracking best and runner-up
         candidates = []
+        best = None
+        second_score = 0.0
         for version in self._versions_cache:
             score, analysis = self.pattern_matcher.calculate_match_score(
                 euring_string, version
             )
             candidates.append((version, score, analysis))
+            if best is None or score > best[1]:
+                if best is not None:
+                    second_score = best[1]
+                best = (version, score, analysis)
+            elif score > second_score:
+                second_score = score
+        
+        if best is None:
+            # No versions loaded: let ambiguity resolution report it as before
+            # the fast path existed, rather than failing on the missing best match
+            best_version, confidence, alternatives, analysis_details = (
+                self.ambiguity_resolver.resolve_ambiguity(candidates, euring_string)
+            )
+        elif best[1] >= self.fast_path_threshold and best[1] - second_score >= self.fast_path_gap:
+            # Dominant match: no alternatives, no context disambiguation needed
+            best_version, confidence, analysis_details = best
+            alternatives = None
+        else:
+            # Resolve ambiguity and get best match
+            best_version, confidence, alternatives, analysis_details = (
+                self.ambiguity_resolver.resolve_ambiguity(candidates, euring_string)
+            )
         
-        # Resolve ambiguity and get best match
-        best_version, confidence, alternatives, analysis_details = (
-            self.ambiguity_resolver.resolve_ambiguity(candidates, euring_string)
-        )
-        
-        # Create analysis metadata
-        analysis_metadata = AnalysisMetadata(**analysis_details)
+        # Create analysis metadata (built internally, so skip pydantic revalidation)
+        analysis_metadata = AnalysisMetadata.model_construct(**analysis_details)
         
-        return RecognitionResult(
+        return RecognitionResult.model_construct(
             detected_version=best_version,
             confidence=confidence,
             alternative_versions=alternatives if alternatives else None,
             analysis_details=analysis_metadata
         )
     
+    async def _process_coalesced_batch(self, strings: List[str]) -> List[RecognitionResult]:
+        """Run coalesced single-string requests through the mixed-version batch path"""
+        return await self.batch_processor.process_mixed_version_batch(
+            strings, self._versions_cache
+        )
+    
     async def recognize_batch(
         self, 
         strings: List[str], 
@@ -718,20 +888,15 @@ class RecognitionEngineImpl(RecognitionEngine):
             )
             
             # Check if all strings were actually detected as same version
-            detected_versions = [r.detected_version.id for r in results]
-            same_version_detected = len(set(detected_versions)) == 1
+            same_version_detected = _all_same_version(results)
             processing_summary['optimization_applied'] = True
             processing_summary['batch_type'] = 'mixed_version_optimized'
             
-            # Organize results by version for mixed batches
+            # Summarize version groups for mixed batches
             if not same_version_detected:
-                organized_results = self.batch_processor.organize_results_by_version(
-                    results, strings
-                )
-                processing_summary['version_groups'] = {
-                    version_id: len(group) 
-                    for version_id, group in organized_results.items()
-                }
+                processing_summary['version_groups'] = dict(Counter(
+                    result.detected_version.id for result in results
+                ))
         else:
             # Auto-detect batch type and apply appropriate optimization
             if len(strings) >= self.batch_processor.batch_size_threshold:
@@ -758,18 +923,20 @@ class RecognitionEngineImpl(RecognitionEngine):
                     results = await self.batch_processor.process_mixed_version_batch(
                         strings, self._versions_cache
                     )
-                    detected_versions = [r.detected_version.id for r in results]
-                    same_version_detected = len(set(detected_versions)) == 1
+                    same_version_detected = _all_same_version(results)
                     processing_summary['optimization_applied'] = True
                     processing_summary['batch_type'] = 'auto_detected_mixed_version'
             else:
-                # Small batch - process individually
-                for string in strings:
-                    result = await self.recognize_version(string)
-                    results.append(result)
+                # Small batch - process individually, concurrently but bounded
+                semaphore = asyncio.Semaphore(self.max_concurrent_recognitions)
                 
-                detected_versions = [r.detected_version.id for r in results]
-                same_version_detected = len(set(detected_versions)) == 1
+                async def recognize_one(string: str) -> RecognitionResult:
+                    async with semaphore:
+                        return await self.recognize_version(string)
+                
+                results = list(await asyncio.gather(*(recognize_one(string) for string in strings)))
+                
+                same_version_detected = _all_same_version(results)
                 processing_summary['batch_type'] = 'individual_processing'
         
         processing_summary['processing_end'] = time.time()
@@ -784,6 +951,22 @@ class RecognitionEngineImpl(RecognitionEngine):
             total_processed=len(strings)
         )
     
+    def clear_versions_cache(self) -> None:
+        """Drop the loaded versions so the next call reloads them from the SKOS manager"""
+        self._versions_cache = None
+        self._version_dicts = None
+        self.pattern_matcher.clear_valid_values_cache()
+    
+    def _version_dict(self, version: EuringVersion) -> Dict[str, Any]:
+        """A serialized copy of a loaded version that the caller is free to modify"""
+        cached = self._version_dicts
+        if cached is None or cached[0] is not self._versions_cache:
+            cached = self._version_dicts = (
+                self._versions_cache,
+                {v.id: pickle.dumps(v.dict()) for v in self._versions_cache}
+            )
+        return pickle.loads(cached[1][version.id])
+    
     def get_confidence_level(self, result: RecognitionResult) -> float:
         """Get confidence level for a recognition result"""
         return result.confidence
@@ -802,11 +985,17 @@ class RecognitionEngineImpl(RecognitionEngine):
             version_model = await self.skos_manager.load_version_model()
             self._versions_cache = version_model.versions
         
+        # Scan the string once for format discriminants; versions that fail them
+        # short-circuit inside calculate_match_score without any field matching
+        discriminant_row = self.pattern_matcher.score_discriminants_batch(
+            [euring_string], self._versions_cache
+        )[0]
+        
         # Calculate match scores for all versions
         candidates = []
-        for version in self._versions_cache:
+        for version, discriminant_score in zip(self._versions_cache, discriminant_row):
             score, analysis = self.pattern_matcher.calculate_match_score(
-                euring_string, version
+                euring_string, version, discriminant_score
             )
             candidates.append((version, score, analysis))
         
@@ -824,7 +1013,7 @@ class RecognitionEngineImpl(RecognitionEngine):
             'uncertainty_reason': uncertainty_info['reason'],
             'options': [
                 {
-                    'version': version.dict(),
+                    'version': self._version_dict(version),
                     'probability': probability,
                     'confidence': probability  # For compatibility
                 }
@@ -2,13 +2,88 @@
 Semantic Converter for EURING Codes
 Handles conversion based on semantic meaning rather than literal values
 """
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Mapping
 from datetime import datetime
+from types import MappingProxyType
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 
 
-@dataclass
+# 8-character date layouts per source version: (year, month, day) slices
+_DATE_PARSERS = {
+    '1966': ((4, 8), (2, 4), (0, 2)),  # DDMMYYYY
+    '2020': ((0, 4), (4, 6), (6, 8)),  # YYYYMMDD
+}
+
+# Shared (immutable) notes for successful conversions, instead of a new list per field
+_EMPTY_NOTES: Tuple[str, ...] = ()
+
+# Prototype for unparseable measurements; copied and given notes on each failure
+_MEASUREMENT_DEFAULT = MappingProxyType({
+    'value': 0.0,
+    'unit': '',
+    'source': 'default',
+    'data_type': 'measurement',
+    'notes': _EMPTY_NOTES
+})
+
+# Degrees/minutes coordinates (DDMM or DDDMM plus hemisphere) and hemisphere sign
+_COORD_RE = re.compile(r'^(\d{2,3})(\d{2})([NSEW])$')
+_COORD_DIR_SIGN = {'N': 1, 'S': -1, 'E': 1, 'W': -1}
+
+
+@lru_cache(maxsize=4096)
+def _normalize_ring_2020(ring_str: str) -> str:
+    """Normalize a ring identifier to the 2020 letters + 5 digits layout"""
+    # str.isalpha / str.isdigit keep any Unicode letters and digits, as rings
+    # have always been filtered; the cache makes the per-character pass rare
+    letters = ''.join(c for c in ring_str if c.isalpha())[:2]
+    digits = ''.join(c for c in ring_str if c.isdigit())[:5]
+    # Pad letters to 3 characters and digits to 5
+    letters = f"{letters}A"[:3]  # Add 'A' if needed, truncate to 3
+    digits = digits.zfill(5)
+    return f"{letters}{digits}"
+
+
+@lru_cache(maxsize=8192)
+def _species5(species_code: int) -> str:
+    """Zero-padded 5-digit species code"""
+    return f"{species_code:05d}"
+
+
+@lru_cache(maxsize=512)
+def _day_month(day: int, month: int) -> str:
+    """DDMM date prefix"""
+    return f"{day:02d}{month:02d}"
+
+
+@lru_cache(maxsize=512)
+def _month_day(month: int, day: int) -> str:
+    """MMDD date suffix"""
+    return f"{month:02d}{day:02d}"
+
+
+@lru_cache(maxsize=None)
+def _unit(field_name: str, version: str) -> str:
+    """Measurement unit for a field in a version (the value itself never changes the unit)"""
+    if field_name == 'wing_measurement':
+        return 'mm'  # Assume mm for all wing measurements
+    
+    elif field_name == 'weight_measurement':
+        if version in ['1966', '1979']:
+            return '0.1g'  # Traditional format uses 0.1g units
+        return 'g'
+    
+    elif field_name == 'bill_measurement':
+        if version in ['1966', '1979']:
+            return '0.1mm'  # Traditional format uses 0.1mm units
+        return 'mm'
+    
+    return ''
+
+
+@dataclass(slots=True, frozen=True)
 class SemanticField:
     """Represents a semantic field with its properties"""
     name: str
@@ -16,21 +91,77 @@ class SemanticField:
     data_type: str
     required: bool = True
     default_value: Any = None
-    conversion_notes: List[str] = None
-    
-    def __post_init__(self):
-        if self.conversion_notes is None:
-            self.conversion_notes = []
+    conversion_notes: Tuple[str, ...] = ()
 
 
 class SemanticConverter:
     """Converts EURING codes based on semantic meaning"""
     
+    # Semantic converter method per field data type
+    _DISPATCH = {
+        'numeric': '_convert_numeric_semantic',
+        'alphanumeric': '_convert_alphanumeric_semantic',
+        'date': '_convert_date_semantic',
+        'time': '_convert_time_semantic',
+        'coordinate': '_convert_coordinate_semantic',
+        'measurement': '_convert_measurement_semantic',
+    }
+    
     def __init__(self):
-        self.semantic_fields = self._define_semantic_fields()
-        self.version_mappings = self._define_version_mappings()
+        (self.semantic_fields, self.version_mappings, self._inverse_mappings,
+         self._missing_field_defaults, self._numeric_defaults) = self._shared_definitions()
+    
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _shared_definitions(cls) -> Tuple[
+            Mapping[str, SemanticField],
+            Mapping[str, Mapping[str, str]],
+            Mapping[str, Mapping[str, Tuple[str, ...]]],
+            Mapping[str, Mapping[str, Any]],
+            Mapping[str, Mapping[str, Any]]]:
+        """
+        Read-only definitions shared by every instance of the class, built once:
+        semantic fields, version mappings, their inverse, and default-result prototypes
+        """
+        semantic_fields = cls._define_semantic_fields()
+        version_mappings = cls._define_version_mappings()
+        
+        # version field name -> semantic field names it feeds (2000 maps scheme_code twice)
+        inverse_mappings = {}
+        for version, mapping in version_mappings.items():
+            inverse: Dict[str, Tuple[str, ...]] = {}
+            for semantic_field_name, version_field_name in mapping.items():
+                if semantic_field_name in semantic_fields:
+                    inverse[version_field_name] = inverse.get(version_field_name, ()) + (semantic_field_name,)
+            inverse_mappings[version] = MappingProxyType(inverse)
+        
+        # Default-result prototypes, copied and given notes on each use
+        missing_field_defaults = MappingProxyType({
+            name: MappingProxyType({'value': field_def.default_value, 'source': 'default', 'notes': _EMPTY_NOTES})
+            for name, field_def in semantic_fields.items()
+        })
+        numeric_defaults = MappingProxyType({
+            name: MappingProxyType({
+                'value': field_def.default_value,
+                'source': 'default',
+                'data_type': 'numeric',
+                'notes': _EMPTY_NOTES
+            })
+            for name, field_def in semantic_fields.items() if field_def.data_type == 'numeric'
+        })
+        
+        return (
+            MappingProxyType(semantic_fields),
+            MappingProxyType({
+                version: MappingProxyType(mapping) for version, mapping in version_mappings.items()
+            }),
+            MappingProxyType(inverse_mappings),
+            missing_field_defaults,
+            numeric_defaults
+        )
     
-    def _define_semantic_fields(self) -> Dict[str, SemanticField]:
+    @classmethod
+    def _define_semantic_fields(cls) -> Dict[str, SemanticField]:
         """Define all semantic fields across EURING versions"""
         return {
             'species_identification': SemanticField(
@@ -128,7 +259,8 @@ class SemanticConverter:
             )
         }
     
-    def _define_version_mappings(self) -> Dict[str, Dict[str, str]]:
+    @classmethod
+    def _define_version_mappings(cls) -> Dict[str, Dict[str, str]]:
         """Define how semantic fields map to version-specific fields"""
         return {
             '1966': {
@@ -205,25 +337,28 @@ class SemanticConverter:
     
     def extract_semantic_data(self, parsed_data: Dict[str, Any], source_version: str) -> Dict[str, Any]:
         """Extract semantic data from parsed version-specific data"""
-        semantic_data = {}
-        version_mapping = self.version_mappings.get(source_version, {})
+        inverse_mapping = self._inverse_mappings.get(source_version, {})
+        
+        # Conversion work scales with the fields actually present in parsed_data
+        converted = {}
+        for version_field_name, raw_value in parsed_data.items():
+            for semantic_field_name in inverse_mapping.get(version_field_name, ()):
+                converted[semantic_field_name] = self._convert_to_semantic(
+                    raw_value, self.semantic_fields[semantic_field_name],
+                    source_version, version_field_name
+                )
         
+        # Assemble in semantic field order: target versions that share a field
+        # name (2000 scheme_code) rely on it when converting back
+        semantic_data = {}
         for semantic_field_name, field_def in self.semantic_fields.items():
-            version_field_name = version_mapping.get(semantic_field_name)
-            
-            if version_field_name and version_field_name in parsed_data:
-                raw_value = parsed_data[version_field_name]
-                semantic_value = self._convert_to_semantic(
-                    raw_value, field_def, source_version, version_field_name
-                )
-                semantic_data[semantic_field_name] = semantic_value
+            if semantic_field_name in converted:
+                semantic_data[semantic_field_name] = converted[semantic_field_name]
             elif field_def.required:
                 # Use default value for required fields
-                semantic_data[semantic_field_name] = {
-                    'value': field_def.default_value,
-                    'source': 'default',
-                    'notes': [f'Field not available in {source_version}, using default']
-                }
+                default_result = self._missing_field_defaults[semantic_field_name].copy()
+                default_result['notes'] = (f'Field not available in {source_version}, using default',)
+                semantic_data[semantic_field_name] = default_result
         
         return semantic_data
     
@@ -231,24 +366,15 @@ class SemanticConverter:
                            source_version: str, version_field_name: str) -> Dict[str, Any]:
         """Convert raw value to semantic representation"""
         
-        if field_def.data_type == 'numeric':
-            return self._convert_numeric_semantic(raw_value, field_def, source_version)
-        elif field_def.data_type == 'alphanumeric':
-            return self._convert_alphanumeric_semantic(raw_value, field_def, source_version)
-        elif field_def.data_type == 'date':
-            return self._convert_date_semantic(raw_value, field_def, source_version)
-        elif field_def.data_type == 'time':
-            return self._convert_time_semantic(raw_value, field_def, source_version)
-        elif field_def.data_type == 'coordinate':
-            return self._convert_coordinate_semantic(raw_value, field_def, source_version)
-        elif field_def.data_type == 'measurement':
-            return self._convert_measurement_semantic(raw_value, field_def, source_version)
-        else:
-            return {
-                'value': raw_value,
-                'source': source_version,
-                'notes': ['Direct copy - unknown data type']
-            }
+        converter_name = self._DISPATCH.get(field_def.data_type)
+        if converter_name:
+            return getattr(self, converter_name)(raw_value, field_def, source_version)
+        
+        return {
+            'value': raw_value,
+            'source': source_version,
+            'notes': ['Direct copy - unknown data type']
+        }
     
     def _convert_numeric_semantic(self, raw_value: Any, field_def: SemanticField, 
                                 source_version: str) -> Dict[str, Any]:
@@ -263,15 +389,12 @@ class SemanticConverter:
                 'value': numeric_value,
                 'source': source_version,
                 'data_type': 'numeric',
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
         except (ValueError, TypeError):
-            return {
-                'value': field_def.default_value,
-                'source': 'default',
-                'data_type': 'numeric',
-                'notes': [f'Could not parse numeric value: {raw_value}']
-            }
+            default_result = self._numeric_defaults[field_def.name].copy()
+            default_result['notes'] = (f'Could not parse numeric value: {raw_value}',)
+            return default_result
     
     def _convert_alphanumeric_semantic(self, raw_value: Any, field_def: SemanticField, 
                                      source_version: str) -> Dict[str, Any]:
@@ -283,7 +406,7 @@ class SemanticConverter:
             'source': source_version,
             'data_type': 'alphanumeric',
             'original_format': f'{source_version}_format',
-            'notes': []
+            'notes': _EMPTY_NOTES
         }
     
     def _convert_date_semantic(self, raw_value: Any, field_def: SemanticField, 
@@ -298,7 +421,7 @@ class SemanticConverter:
                 'source': source_version,
                 'data_type': 'date',
                 'original_format': raw_value.get('original', ''),
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
         
         # Try to parse different date formats
@@ -306,20 +429,11 @@ class SemanticConverter:
         
         try:
             if len(date_str) == 8:
-                if source_version in ['1966']:
-                    # DDMMYYYY format
-                    day = int(date_str[:2])
-                    month = int(date_str[2:4])
-                    year = int(date_str[4:])
-                    date_obj = datetime(year, month, day)
-                elif source_version in ['2020']:
-                    # YYYYMMDD format
-                    year = int(date_str[:4])
-                    month = int(date_str[4:6])
-                    day = int(date_str[6:])
-                    date_obj = datetime(year, month, day)
-                else:
+                layout = _DATE_PARSERS.get(source_version)
+                if layout is None:
                     raise ValueError("Unknown date format")
+                (y0, y1), (m0, m1), (d0, d1) = layout
+                date_obj = datetime(int(date_str[y0:y1]), int(date_str[m0:m1]), int(date_str[d0:d1]))
             elif len(date_str) == 6:
                 # DDMMYY format (1979)
                 day = int(date_str[:2])
@@ -336,7 +450,7 @@ class SemanticConverter:
                 'source': source_version,
                 'data_type': 'date',
                 'original_format': date_str,
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
             
         except (ValueError, TypeError) as e:
@@ -360,7 +474,7 @@ class SemanticConverter:
                 'data_type': 'coordinate',
                 'format': 'decimal',
                 'original': raw_value.get('original', ''),
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
         
         if isinstance(raw_value, (int, float)):
@@ -370,7 +484,7 @@ class SemanticConverter:
                 'source': source_version,
                 'data_type': 'coordinate',
                 'format': 'decimal',
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
         
         # Try to parse string coordinate
@@ -385,43 +499,28 @@ class SemanticConverter:
                 'data_type': 'coordinate',
                 'format': 'decimal',
                 'original': coord_str,
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
         except ValueError:
             pass
         
-        # Try degrees/minutes format
-        if len(coord_str) >= 4 and coord_str[-1] in 'NSEW':
-            try:
-                direction = coord_str[-1]
-                numbers = coord_str[:-1]
-                
-                if len(numbers) == 4:  # DDMM
-                    degrees = int(numbers[:2])
-                    minutes = int(numbers[2:])
-                elif len(numbers) == 5:  # DDDMM
-                    degrees = int(numbers[:3])
-                    minutes = int(numbers[3:])
-                else:
-                    raise ValueError("Unknown coordinate format")
-                
-                decimal = degrees + (minutes / 60.0)
-                if direction in 'SW':
-                    decimal = -decimal
-                
-                return {
-                    'value': decimal,
-                    'source': source_version,
-                    'data_type': 'coordinate',
-                    'format': 'degrees_minutes',
-                    'original': coord_str,
-                    'degrees': degrees,
-                    'minutes': minutes,
-                    'direction': direction,
-                    'notes': []
-                }
-            except (ValueError, IndexError):
-                pass
+        # Try degrees/minutes format (DDMM or DDDMM)
+        match = _COORD_RE.match(coord_str)
+        if match:
+            degrees, minutes, direction = int(match[1]), int(match[2]), match[3]
+            decimal = _COORD_DIR_SIGN[direction] * (degrees + (minutes / 60.0))
+            
+            return {
+                'value': decimal,
+                'source': source_version,
+                'data_type': 'coordinate',
+                'format': 'degrees_minutes',
+                'original': coord_str,
+                'degrees': degrees,
+                'minutes': minutes,
+                'direction': direction,
+                'notes': _EMPTY_NOTES
+            }
         
         return {
             'value': 0.0,
@@ -443,7 +542,7 @@ class SemanticConverter:
                 'unit': raw_value.get('unit', ''),
                 'source': source_version,
                 'data_type': 'measurement',
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
         
         try:
@@ -460,44 +559,17 @@ class SemanticConverter:
                 'unit': unit,
                 'source': source_version,
                 'data_type': 'measurement',
-                'notes': []
+                'notes': _EMPTY_NOTES
             }
             
         except (ValueError, TypeError):
-            return {
-                'value': 0.0,
-                'unit': '',
-                'source': 'default',
-                'data_type': 'measurement',
-                'notes': [f'Could not parse measurement: {raw_value}']
-            }
+            default_result = _MEASUREMENT_DEFAULT.copy()
+            default_result['notes'] = (f'Could not parse measurement: {raw_value}',)
+            return default_result
     
     def _determine_measurement_unit(self, field_name: str, version: str, value: float) -> str:
         """Determine the unit of measurement based on field, version, and value"""
-        
-        if field_name == 'wing_measurement':
-            if version in ['2020'] or value > 50:
-                return 'mm'
-            else:
-                return 'mm'  # Assume mm for all wing measurements
-        
-        elif field_name == 'weight_measurement':
-            if version in ['1966', '1979']:
-                return '0.1g'  # Traditional format uses 0.1g units
-            elif version in ['2020']:
-                return 'g'
-            else:
-                return 'g'
-        
-        elif field_name == 'bill_measurement':
-            if version in ['1966', '1979']:
-                return '0.1mm'  # Traditional format uses 0.1mm units
-            elif version in ['2020']:
-                return 'mm'
-            else:
-                return 'mm'
-        
-        return ''
+        return _unit(field_name, version)
     
     def convert_semantic_to_version(self, semantic_data: Dict[str, Any], 
                                   target_version: str) -> Dict[str, Any]:
@@ -547,21 +619,16 @@ class SemanticConverter:
         if semantic_field_name == 'species_identification':
             if target_version == '1966':
                 # Remove leading zero for 1966
-                return int(str(value).lstrip('0')) if str(value).startswith('0') else value
+                species_str = str(value)
+                return int(species_str.lstrip('0') or '0') if species_str[:1] == '0' else value
             else:
                 # Add leading zero for other versions
-                return f"{int(value):05d}"
+                return _species5(int(value))
         
         elif semantic_field_name == 'ring_identification':
             if target_version == '2020':
                 # Ensure 3 letters + 5 digits format for 2020
-                ring_str = str(value)
-                letters = ''.join(c for c in ring_str if c.isalpha())[:2]
-                digits = ''.join(c for c in ring_str if c.isdigit())[:5]
-                # Pad letters to 3 characters and digits to 5
-                letters = f"{letters}A"[:3]  # Add 'A' if needed, truncate to 3
-                digits = digits.zfill(5)
-                return f"{letters}{digits}"
+                return _normalize_ring_2020(str(value))
             else:
                 return value
         
@@ -570,11 +637,11 @@ class SemanticConverter:
                 return '01011900' if target_version == '2020' else '01011900'
             
             if target_version == '1966':
-                return f"{value.day:02d}{value.month:02d}{value.year:04d}"
+                return f"{_day_month(value.day, value.month)}{value.year:04d}"
             elif target_version == '2020':
-                return f"{value.year:04d}{value.month:02d}{value.day:02d}"
+                return f"{value.year:04d}{_month_day(value.month, value.day)}"
             elif target_version in ['1979']:
-                return f"{value.day:02d}{value.month:02d}{value.year % 100:02d}"
+                return f"{_day_month(value.day, value.month)}{value.year % 100:02d}"
         
         elif semantic_field_name in ['geographic_latitude', 'geographic_longitude']:
             if data_type == 'coordinate':
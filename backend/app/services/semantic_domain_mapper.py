@@ -2,8 +2,141 @@
 Semantic Domain Mapper Service
 Automatically assigns semantic domains to EURING fields based on their names and meanings
 """
-from typing import Dict, List, Optional
+from collections import Counter
+from functools import lru_cache
+from operator import attrgetter
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, Optional, Set, Tuple
 from ..models.euring_models import SemanticDomain, FieldDefinition
+from .pattern_trie import PatternTrie
+
+
+# Mapping rules based on field names and semantic meanings. The pattern trie is
+# compiled from these once at import, so they are read-only: changing them later
+# could not affect classification
+_FIELD_NAME_MAPPINGS: Mapping[SemanticDomain, Tuple[str, ...]] = MappingProxyType({
+    # Identification & Marking
+    SemanticDomain.IDENTIFICATION_MARKING: (
+        'scheme', 'scheme_code', 'ring_prefix', 'ring_number', 'ring_series',
+        'identification_number', 'primary_identification_method',
+        'verification_metal_ring', 'metal_ring_information', 'other_marks',
+        'ring_type', 'ring_material', 'ring_condition', 'ring_readability'
+    ),
+
+    # Species
+    SemanticDomain.SPECIES: (
+        'species', 'species_reported', 'species_concluded', 'species_code',
+        'taxonomy', 'subspecies', 'species_group', 'family', 'genus'
+    ),
+
+    # Demographics  
+    SemanticDomain.DEMOGRAPHICS: (
+        'sex', 'sex_reported', 'sex_concluded', 'age', 'age_reported', 'age_concluded',
+        'status', 'brood_size', 'pullus_age', 'accuracy_pullus_age',
+        'breeding_status', 'reproductive_status', 'maturity'
+    ),
+
+    # Temporal
+    SemanticDomain.TEMPORAL: (
+        'day', 'month', 'year', 'date', 'time', 'accuracy_date', 'accuracy_time',
+        'elapsed_time', 'season', 'period', 'timestamp', 'datetime',
+        'capture_date', 'recovery_date', 'observation_date'
+    ),
+
+    # Spatial
+    SemanticDomain.SPATIAL: (
+        'latitude', 'longitude', 'coordinates', 'area_code', 'area_code_edb',
+        'accuracy_coordinates', 'location', 'place', 'site', 'region',
+        'country', 'locality', 'habitat', 'elevation', 'distance', 'direction'
+    ),
+
+    # Biometrics
+    SemanticDomain.BIOMETRICS: (
+        'wing', 'weight', 'bill', 'tarsus', 'fat', 'muscle', 'moult',
+        'body_mass', 'wing_length', 'bill_length', 'tarsus_length',
+        'fat_score', 'muscle_score', 'moult_score', 'condition_score',
+        'biometric', 'measurement', 'morphology'
+    ),
+
+    # Methodology
+    SemanticDomain.METHODOLOGY: (
+        'manipulation', 'moved_before', 'catching_method', 'lures_used',
+        'condition_code', 'circumstances_code', 'circumstances_presumed',
+        'euring_code_identifier', 'method', 'technique', 'protocol',
+        'equipment', 'trap_type', 'net_type', 'capture_effort',
+        'weather', 'conditions', 'observer', 'ringer'
+    )
+})
+
+# Semantic meaning mappings
+_SEMANTIC_MEANING_MAPPINGS: Mapping[SemanticDomain, Tuple[str, ...]] = MappingProxyType({
+    SemanticDomain.IDENTIFICATION_MARKING: (
+        'ringing scheme', 'ring number', 'ring series', 'metal ring',
+        'identification', 'marking', 'scheme identifier', 'ring prefix'
+    ),
+
+    SemanticDomain.SPECIES: (
+        'species', 'taxonomy', 'classification', 'scientific name',
+        'common name', 'subspecies', 'family', 'genus'
+    ),
+
+    SemanticDomain.DEMOGRAPHICS: (
+        'sex', 'age', 'gender', 'maturity', 'breeding', 'reproductive',
+        'status', 'brood', 'pullus', 'demographic'
+    ),
+
+    SemanticDomain.TEMPORAL: (
+        'date', 'time', 'temporal', 'chronological', 'when',
+        'day', 'month', 'year', 'season', 'period', 'elapsed'
+    ),
+
+    SemanticDomain.SPATIAL: (
+        'location', 'position', 'coordinates', 'latitude', 'longitude',
+        'spatial', 'geographic', 'place', 'site', 'area', 'region',
+        'distance', 'direction', 'where'
+    ),
+
+    SemanticDomain.BIOMETRICS: (
+        'measurement', 'biometric', 'morphology', 'size', 'length',
+        'weight', 'mass', 'wing', 'bill', 'tarsus', 'fat', 'muscle',
+        'moult', 'condition', 'physical'
+    ),
+
+    SemanticDomain.METHODOLOGY: (
+        'method', 'technique', 'protocol', 'procedure', 'how',
+        'capture', 'catching', 'manipulation', 'circumstances',
+        'conditions', 'equipment', 'trap', 'net', 'lure'
+    )
+})
+
+# Domains are scored by position; ties go to the earliest domain
+_DOMAIN_BY_INDEX: List[SemanticDomain] = list(_FIELD_NAME_MAPPINGS)
+_DOMAIN_INDEX: Dict[SemanticDomain, int] = {domain: i for i, domain in enumerate(_DOMAIN_BY_INDEX)}
+
+
+def _build_pattern_trie() -> Tuple[PatternTrie, List[Tuple[int, int]]]:
+    """Compile both pattern tables into one trie; entry id -> (domain index, weight)"""
+    entries: List[Tuple[int, int]] = []
+    trie = PatternTrie()
+    for domain, field_names in _FIELD_NAME_MAPPINGS.items():
+        for name_pattern in field_names:
+            trie.add(name_pattern.encode(), len(entries), name_only=True)
+            entries.append((_DOMAIN_INDEX[domain], 10))  # High weight for field name matches
+    for domain, meanings in _SEMANTIC_MEANING_MAPPINGS.items():
+        for meaning_pattern in meanings:
+            trie.add(meaning_pattern.encode(), len(entries))
+            entries.append((_DOMAIN_INDEX[domain], 5))  # Medium weight for semantic meaning matches
+    trie.build()
+    return trie, entries
+
+
+# The tables are fixed, so the automaton is built once at import and shared
+_PATTERN_TRIE, _PATTERN_ENTRIES = _build_pattern_trie()
+
+# Total weight of each domain's meaning patterns, the most it can gain from
+# text after the field name
+_MEANING_BUDGET: List[int] = [5 * len(_SEMANTIC_MEANING_MAPPINGS[domain]) for domain in _DOMAIN_BY_INDEX]
+_RUNNER_UP_BUDGET = sorted(_MEANING_BUDGET)[-2]
 
 
 class SemanticDomainMapper:
@@ -11,164 +144,133 @@ class SemanticDomainMapper:
     Maps EURING fields to semantic domains based on field names, descriptions, and semantic meanings
     """
     
+    field_name_mappings = _FIELD_NAME_MAPPINGS
+    semantic_meaning_mappings = _SEMANTIC_MEANING_MAPPINGS
+    
+    _domain_by_index = _DOMAIN_BY_INDEX
+    _domain_index = _DOMAIN_INDEX
+    _num_domains = len(_DOMAIN_BY_INDEX)
+    _trie = _PATTERN_TRIE
+    _entries = _PATTERN_ENTRIES
+    _meaning_budget = _MEANING_BUDGET
+    _runner_up_budget = _RUNNER_UP_BUDGET
+    
     def __init__(self):
-        # Mapping rules based on field names and semantic meanings
-        self.field_name_mappings = {
-            # Identification & Marking
-            SemanticDomain.IDENTIFICATION_MARKING: [
-                'scheme', 'scheme_code', 'ring_prefix', 'ring_number', 'ring_series',
-                'identification_number', 'primary_identification_method',
-                'verification_metal_ring', 'metal_ring_information', 'other_marks',
-                'ring_type', 'ring_material', 'ring_condition', 'ring_readability'
-            ],
-            
-            # Species
-            SemanticDomain.SPECIES: [
-                'species', 'species_reported', 'species_concluded', 'species_code',
-                'taxonomy', 'subspecies', 'species_group', 'family', 'genus'
-            ],
-            
-            # Demographics  
-            SemanticDomain.DEMOGRAPHICS: [
-                'sex', 'sex_reported', 'sex_concluded', 'age', 'age_reported', 'age_concluded',
-                'status', 'brood_size', 'pullus_age', 'accuracy_pullus_age',
-                'breeding_status', 'reproductive_status', 'maturity'
-            ],
-            
-            # Temporal
-            SemanticDomain.TEMPORAL: [
-                'day', 'month', 'year', 'date', 'time', 'accuracy_date', 'accuracy_time',
-                'elapsed_time', 'season', 'period', 'timestamp', 'datetime',
-                'capture_date', 'recovery_date', 'observation_date'
-            ],
-            
-            # Spatial
-            SemanticDomain.SPATIAL: [
-                'latitude', 'longitude', 'coordinates', 'area_code', 'area_code_edb',
-                'accuracy_coordinates', 'location', 'place', 'site', 'region',
-                'country', 'locality', 'habitat', 'elevation', 'distance', 'direction'
-            ],
-            
-            # Biometrics
-            SemanticDomain.BIOMETRICS: [
-                'wing', 'weight', 'bill', 'tarsus', 'fat', 'muscle', 'moult',
-                'body_mass', 'wing_length', 'bill_length', 'tarsus_length',
-                'fat_score', 'muscle_score', 'moult_score', 'condition_score',
-                'biometric', 'measurement', 'morphology'
-            ],
-            
-            # Methodology
-            SemanticDomain.METHODOLOGY: [
-                'manipulation', 'moved_before', 'catching_method', 'lures_used',
-                'condition_code', 'circumstances_code', 'circumstances_presumed',
-                'euring_code_identifier', 'method', 'technique', 'protocol',
-                'equipment', 'trap_type', 'net_type', 'capture_effort',
-                'weather', 'conditions', 'observer', 'ringer'
-            ]
-        }
-        
-        # Semantic meaning mappings
-        self.semantic_meaning_mappings = {
-            SemanticDomain.IDENTIFICATION_MARKING: [
-                'ringing scheme', 'ring number', 'ring series', 'metal ring',
-                'identification', 'marking', 'scheme identifier', 'ring prefix'
-            ],
-            
-            SemanticDomain.SPECIES: [
-                'species', 'taxonomy', 'classification', 'scientific name',
-                'common name', 'subspecies', 'family', 'genus'
-            ],
-            
-            SemanticDomain.DEMOGRAPHICS: [
-                'sex', 'age', 'gender', 'maturity', 'breeding', 'reproductive',
-                'status', 'brood', 'pullus', 'demographic'
-            ],
-            
-            SemanticDomain.TEMPORAL: [
-                'date', 'time', 'temporal', 'chronological', 'when',
-                'day', 'month', 'year', 'season', 'period', 'elapsed'
-            ],
-            
-            SemanticDomain.SPATIAL: [
-                'location', 'position', 'coordinates', 'latitude', 'longitude',
-                'spatial', 'geographic', 'place', 'site', 'area', 'region',
-                'distance', 'direction', 'where'
-            ],
-            
-            SemanticDomain.BIOMETRICS: [
-                'measurement', 'biometric', 'morphology', 'size', 'length',
-                'weight', 'mass', 'wing', 'bill', 'tarsus', 'fat', 'muscle',
-                'moult', 'condition', 'physical'
-            ],
-            
-            SemanticDomain.METHODOLOGY: [
-                'method', 'technique', 'protocol', 'procedure', 'how',
-                'capture', 'catching', 'manipulation', 'circumstances',
-                'conditions', 'equipment', 'trap', 'net', 'lure'
-            ]
-        }
+        # Classification is a pure function of the field text (the trie is
+        # fixed once built), so identical text is only ever lowered and scored
+        # once; keyed on the raw strings so hits skip the lowering too
+        self._classify = lru_cache(maxsize=4096)(self._assign_from_parts)
+        # Field names recur across versions with differing descriptions, so the
+        # name part of the scan is also looked up by name alone
+        self._scan_name = lru_cache(maxsize=4096)(self._scan_name_text)
     
     def assign_semantic_domain(self, field: FieldDefinition) -> SemanticDomain:
         """
         Assign a semantic domain to a field based on its name, description, and semantic meaning
         """
-        field_name_lower = field.name.lower()
-        description_lower = field.description.lower() if field.description else ""
-        semantic_meaning_lower = field.semantic_meaning.lower() if field.semantic_meaning else ""
-        
-        # Combined text for analysis
-        combined_text = f"{field_name_lower} {description_lower} {semantic_meaning_lower}"
+        return self._classify(field.name, field.description, field.semantic_meaning)
+    
+    def _assign_from_parts(self, name: str, description: Optional[str],
+                           semantic_meaning: Optional[str]) -> SemanticDomain:
+        """Assign a semantic domain from a field's raw name, description and semantic meaning"""
+        field_name_lower = name.lower()
+        description_lower = description.lower() if description else ""
+        semantic_meaning_lower = semantic_meaning.lower() if semantic_meaning else ""
+        return self._classify_text(field_name_lower, description_lower, semantic_meaning_lower)
+    
+    def _classify_text(self, field_name_lower: str, description_lower: str,
+                       semantic_meaning_lower: str) -> SemanticDomain:
+        """Score lowered field text against the pattern tables"""
+        # Score each domain: every pattern found adds its weight once. The text
+        # is scanned as "name description semantic_meaning", name patterns only
+        # counting inside the name
+        state, name_entries, name_scores, decided = self._scan_name(field_name_lower)
+        if decided is not None:
+            return decided
         
-        # Score each domain
-        domain_scores = {}
+        rest_entries: Set[int] = set()
+        self._trie.scan(state, (b' ', description_lower.encode(), b' ', semantic_meaning_lower.encode()),
+                        rest_entries)
+        scores = list(name_scores)
+        entries = self._entries
+        for entry_id in rest_entries:
+            if entry_id not in name_entries:
+                domain_i, weight = entries[entry_id]
+                scores[domain_i] += weight
+        return self._best_domain(scores)
+    
+    def _best_domain(self, scores: List[int]) -> SemanticDomain:
+        """Domain with the highest score (first one wins ties), METHODOLOGY if none scored"""
+        best_i, best_score = 0, scores[0]
+        for i in range(1, self._num_domains):
+            if scores[i] > best_score:
+                best_i, best_score = i, scores[i]
+        if best_score > 0:
+            return self._domain_by_index[best_i]
+        else:
+            return SemanticDomain.METHODOLOGY  # Default fallback if no clear match
+    
+    def _scan_name_text(self, field_name_lower: str) -> Tuple[
+            int, FrozenSet[int], Tuple[int, ...], Optional[SemanticDomain]]:
+        """
+        Scan a lowered field name: the automaton state after it, the entries it
+        matches, the per-domain scores they give, and the domain if those alone
+        decide it
+        """
+        name_entries: Set[int] = set()
+        state = self._trie.scan_name(field_name_lower.encode(), name_entries)
+        scores = [0] * self._num_domains
+        entries = self._entries
+        for entry_id in name_entries:
+            domain_i, weight = entries[entry_id]
+            scores[domain_i] += weight
         
-        for domain, field_names in self.field_name_mappings.items():
-            score = 0
-            
-            # Check field name matches
-            for name_pattern in field_names:
-                if name_pattern in field_name_lower:
-                    score += 10  # High weight for field name matches
-            
-            # Check semantic meaning matches
-            if domain in self.semantic_meaning_mappings:
-                for meaning_pattern in self.semantic_meaning_mappings[domain]:
-                    if meaning_pattern in combined_text:
-                        score += 5  # Medium weight for semantic meaning matches
-            
-            domain_scores[domain] = score
+        decided = None
+        # The leader must beat every other domain's meaning budget, so with too
+        # few name matches the rest of the text always has to be scanned
+        if 10 * len(name_entries) >= self._runner_up_budget and self._lead_is_unbeatable(name_entries, scores):
+            decided = self._best_domain(scores)
+        return state, frozenset(name_entries), tuple(scores), decided
+    
+    def _lead_is_unbeatable(self, name_entries: Set[int], scores: List[int]) -> bool:
+        """
+        Whether the leader after scanning the field name must also win once the
+        description and meaning are scanned, so they can be skipped
+        """
+        # The text after the name can only add meaning patterns; a domain's
+        # ceiling is its name matches plus its whole meaning budget
+        bounds = list(self._meaning_budget)
+        entries = self._entries
+        for entry_id in name_entries:
+            domain_i, weight = entries[entry_id]
+            if weight == 10:
+                bounds[domain_i] += weight
         
-        # Return domain with highest score, or default to METHODOLOGY if no clear match
-        if max(domain_scores.values()) > 0:
-            return max(domain_scores, key=domain_scores.get)
-        else:
-            return SemanticDomain.METHODOLOGY  # Default fallback
+        # The name matched at least one pattern, so the leader has a positive
+        # score and _best_domain names it rather than the fallback
+        best_i = self._domain_index[self._best_domain(scores)]
+        best_score = scores[best_i]
+        return all(bound < best_score or (bound == best_score and i > best_i)
+                   for i, bound in enumerate(bounds) if i != best_i)
     
     def assign_domains_to_fields(self, fields: List[FieldDefinition]) -> List[FieldDefinition]:
         """
-        Assign semantic domains to a list of fields
+        Assign semantic domains to a list of fields (in place; the same list is returned)
         """
-        updated_fields = []
-        
         for field in fields:
-            # Only assign if not already assigned
+            # Only assign if not already assigned; recurring field text is
+            # answered by the classification cache
             if field.semantic_domain is None:
                 field.semantic_domain = self.assign_semantic_domain(field)
-            updated_fields.append(field)
         
-        return updated_fields
+        return fields
     
     def get_domain_statistics(self, fields: List[FieldDefinition]) -> Dict[SemanticDomain, int]:
         """
         Get statistics of domain distribution across fields
         """
-        stats = {domain: 0 for domain in SemanticDomain}
-        
-        for field in fields:
-            if field.semantic_domain:
-                stats[field.semantic_domain] += 1
-        
-        return stats
+        counts = Counter(map(attrgetter('semantic_domain'), fields))
+        return {domain: counts[domain] for domain in SemanticDomain}
     
     def validate_domain_assignment(self, field: FieldDefinition) -> bool:
         """
@@ -191,15 +293,13 @@ class SemanticDomainMapper:
     
     def reassign_all_domains(self, fields: List[FieldDefinition]) -> List[FieldDefinition]:
         """
-        Reassign semantic domains to all fields (override existing assignments)
+        Reassign semantic domains to all fields (override existing assignments).
+        Fields are updated in place and the same list is returned.
         """
-        updated_fields = []
-        
         for field in fields:
             field.semantic_domain = self.assign_semantic_domain(field)
-            updated_fields.append(field)
         
-        return updated_fields
+        return fields
 
 
 # Global instance
@@ -7,17 +7,27 @@ and categorization.
 
 Requirements: 8.4
 """
-from typing import Dict, List, Optional, Set, Tuple, Any
-from collections import defaultdict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Any
+from collections import Counter, defaultdict
+from functools import lru_cache
+from heapq import nlargest
+from operator import attrgetter, itemgetter
+import hashlib
 import re
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from ..models.euring_models import (
     SemanticDomain, FieldDefinition, EuringVersion, 
     DomainEvolutionEntry, SemanticDomainDefinition
 )
+from .pattern_trie import PatternTrie
 
 
-@dataclass
+# C-level getter for the confidence reductions
+_confidence = attrgetter("confidence")
+
+
+@dataclass(slots=True)
 class SemanticRelationship:
     """Represents a semantic relationship between fields"""
     field1: str
@@ -28,7 +38,7 @@ class SemanticRelationship:
     domain: SemanticDomain
 
 
-@dataclass
+@dataclass(slots=True)
 class FieldGroup:
     """Represents a group of semantically related fields"""
     group_id: str
@@ -40,16 +50,24 @@ class FieldGroup:
     relationships: List[SemanticRelationship]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SemanticMeaning:
     """Represents extracted semantic meaning of a field"""
+    # Instances are shared through the extraction cache, so sequences are tuples
     field_name: str
     primary_concept: str
-    secondary_concepts: List[str]
+    secondary_concepts: Tuple[str, ...]
     semantic_category: str
     domain: SemanticDomain
     confidence: float  # 0.0 to 1.0
-    linguistic_patterns: List[str]
+    linguistic_patterns: Tuple[str, ...]
+    # Primary plus secondary concepts, precomputed for pairwise overlap scoring
+    concept_set: FrozenSet[str] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(
+            self, "concept_set", frozenset((self.primary_concept, *self.secondary_concepts))
+        )
 
 
 class SemanticFieldGrouper:
@@ -62,10 +80,74 @@ class SemanticFieldGrouper:
     - Semantic meaning extraction and categorization
     """
     
+    # Linguistic pattern probes, compiled once rather than looked up in re's cache per field
+    _UPPERCASE_RX = re.compile(r'[A-Z]')
+    _DIGITS_RX = re.compile(r'\d')
+    _NAME_SEPARATOR_RX = re.compile(r'[_\-\s]+')
+    # Measurement terms recognised by field dependency detection
+    _MEASUREMENT_NAME_RX = re.compile(r'length|weight|score')
+    
     def __init__(self):
         self._semantic_patterns = self._initialize_semantic_patterns()
+        # Literal patterns (all of them today) go into one automaton scanned once
+        # over the whole name: they contain no separator, so every hit lies inside
+        # a single name part. Anything else keeps a per-category alternation that
+        # is searched part by part
+        self._name_pattern_categories: List[str] = list(self._semantic_patterns)
+        self._name_pattern_automaton = PatternTrie()
+        self._residual_name_patterns: Dict[str, re.Pattern] = {}
+        for category_id, (category, patterns) in enumerate(self._semantic_patterns.items()):
+            residual = []
+            for pattern in patterns:
+                if re.escape(pattern) == pattern and not self._NAME_SEPARATOR_RX.search(pattern):
+                    self._name_pattern_automaton.add(pattern.encode(), category_id)
+                else:
+                    residual.append(pattern)
+            if residual:
+                self._residual_name_patterns[category] = re.compile(
+                    "|".join(f"(?:{pattern})" for pattern in residual)
+                )
+        self._name_pattern_automaton.build()
         self._domain_vocabularies = self._initialize_domain_vocabularies()
+        # All vocabulary terms in one automaton, so a description is scanned once;
+        # entry id -> concept label, ids in vocabulary order
+        self._vocab_concepts: List[str] = []
+        self._vocab_automaton = PatternTrie()
+        for domain, vocab in self._domain_vocabularies.items():
+            for category, terms in vocab.items():
+                for term in terms:
+                    self._vocab_automaton.add(term.encode(), len(self._vocab_concepts))
+                    self._vocab_concepts.append(sys.intern(f"{domain.value}_{category}"))
+        self._vocab_automaton.build()
+        # Per domain, (term, category label) in vocabulary order for categorization
+        self._term_to_category: Dict[SemanticDomain, List[Tuple[str, str]]] = {
+            domain: [
+                (term, f"{domain.value}_{category}")
+                for category, terms in vocab.items() for term in terms
+            ]
+            for domain, vocab in self._domain_vocabularies.items()
+        }
+        # Categorization depends only on the primary concept and domain, and a
+        # handful of concepts ("ring", "date", ...) recur across most fields
+        self._categorize_concept = lru_cache(maxsize=2048)(self._categorize_concept_uncached)
+        # Group themes depend only on the distinct categories and concepts, which
+        # repeat across groups
+        self._semantic_theme = lru_cache(maxsize=1024)(self._semantic_theme_uncached)
         self._relationship_rules = self._initialize_relationship_rules()
+        # Compiled (first, second, strength) for the two-sided rules, in rule order
+        self._relationship_pattern_pairs: List[Tuple[re.Pattern, re.Pattern, float]] = [
+            (re.compile(rule["pattern"][0]), re.compile(rule["pattern"][1]), rule["strength"])
+            for rule in self._relationship_rules if len(rule["pattern"]) == 2
+        ]
+        # Upper bound on the pattern match a pair can score, for candidate pruning
+        self._max_pattern_strength = max(
+            (strength for _, _, strength in self._relationship_pattern_pairs), default=0.0
+        )
+        # The same field recurs across versions; extraction depends only on these
+        # attributes, so each distinct combination is analysed once
+        self._extract_semantic_meaning_cached = lru_cache(maxsize=4096)(
+            self._extract_semantic_meaning_uncached
+        )
     
     def group_fields_by_semantics(
         self,
@@ -131,14 +213,20 @@ class SemanticFieldGrouper:
         # Analyze field evolution patterns within domain
         evolution_patterns = self._analyze_field_evolution_patterns(version_field_map)
         
+        # Extract semantic meanings once for every analysis that needs them
+        semantic_meanings = [self.extract_semantic_meaning(field) for field in domain_fields]
+        
         # Identify domain-specific semantic themes
-        semantic_themes = self._identify_domain_semantic_themes(domain_fields, domain)
+        semantic_themes = self._identify_domain_semantic_themes(semantic_meanings, domain)
         
         # Analyze field naming conventions
         naming_conventions = self._analyze_domain_naming_conventions(domain_fields, domain)
         
         # Calculate domain cohesion metrics
-        cohesion_metrics = self._calculate_domain_cohesion(domain_fields, domain)
+        cohesion_metrics = self._calculate_domain_cohesion(semantic_meanings, domain)
+        
+        # Per-field version counts, shared by the stability summaries
+        field_counts = self._field_version_counts(version_field_map)
         
         # Identify cross-field dependencies
         field_dependencies = self._identify_field_dependencies(domain_fields, domain)
@@ -154,8 +242,8 @@ class SemanticFieldGrouper:
             "field_dependencies": field_dependencies,
             "domain_vocabulary": self._domain_vocabularies.get(domain, {}),
             "analysis_summary": {
-                "most_stable_fields": self._find_most_stable_fields(version_field_map),
-                "most_volatile_fields": self._find_most_volatile_fields(version_field_map),
+                "most_stable_fields": self._find_most_stable_fields(version_field_map, field_counts),
+                "most_volatile_fields": self._find_most_volatile_fields(version_field_map, field_counts),
                 "semantic_consistency_score": cohesion_metrics.get("consistency_score", 0.0)
             }
         }
@@ -172,15 +260,27 @@ class SemanticFieldGrouper:
             
         Validates: Requirements 8.4
         """
+        return self._extract_semantic_meaning_cached(
+            field.name, field.description, field.semantic_domain, bool(field.semantic_meaning)
+        )
+    
+    def _extract_semantic_meaning_uncached(
+        self,
+        name: str,
+        description: str,
+        semantic_domain: Optional[SemanticDomain],
+        has_semantic_meaning: bool
+    ) -> SemanticMeaning:
+        """Extract semantic meaning from the field attributes it depends on"""
         # Analyze field name for semantic patterns
-        name_concepts = self._extract_concepts_from_name(field.name)
+        name_concepts = self._extract_concepts_from_name(name)
         
         # Analyze description for additional semantic information
-        description_concepts = self._extract_concepts_from_description(field.description)
+        description_concepts = self._extract_concepts_from_description(description)
         
         # Determine primary concept
         primary_concept = self._determine_primary_concept(
-            name_concepts, description_concepts, field.semantic_domain
+            name_concepts, description_concepts, semantic_domain
         )
         
         # Identify secondary concepts
@@ -190,25 +290,25 @@ class SemanticFieldGrouper:
         
         # Categorize semantic meaning
         semantic_category = self._categorize_semantic_meaning(
-            primary_concept, secondary_concepts, field.semantic_domain
+            primary_concept, secondary_concepts, semantic_domain
         )
         
         # Calculate confidence based on pattern matches
         confidence = self._calculate_semantic_confidence(
-            field, primary_concept, secondary_concepts
+            semantic_domain, has_semantic_meaning, primary_concept, secondary_concepts
         )
         
         # Identify linguistic patterns
-        linguistic_patterns = self._identify_linguistic_patterns(field.name, field.description)
+        linguistic_patterns = self._identify_linguistic_patterns(name, description)
         
         return SemanticMeaning(
-            field_name=field.name,
+            field_name=sys.intern(name),
             primary_concept=primary_concept,
-            secondary_concepts=secondary_concepts,
+            secondary_concepts=tuple(secondary_concepts),
             semantic_category=semantic_category,
-            domain=field.semantic_domain or SemanticDomain.METHODOLOGY,
+            domain=semantic_domain or SemanticDomain.METHODOLOGY,
             confidence=confidence,
-            linguistic_patterns=linguistic_patterns
+            linguistic_patterns=tuple(linguistic_patterns)
         )
     
     def categorize_semantic_fields(
@@ -351,22 +451,141 @@ class SemanticFieldGrouper:
         semantic_meanings: List[SemanticMeaning]
     ) -> List[SemanticRelationship]:
         """Calculate semantic relationships between fields"""
-        relationships = []
+        candidates, pattern_strengths = self._candidate_pairs(semantic_meanings)
         
-        for i, meaning1 in enumerate(semantic_meanings):
-            for j, meaning2 in enumerate(semantic_meanings[i+1:], i+1):
-                relationship = self._calculate_pairwise_relationship(meaning1, meaning2)
-                if relationship and relationship.strength > 0.3:  # Threshold for meaningful relationships
-                    relationships.append(relationship)
+        # Threshold for meaningful relationships; objects are only built for
+        # the pairs that clear it
+        return [
+            self._build_relationship(
+                semantic_meanings[i], semantic_meanings[j], strength, pattern_match
+            )
+            for i, j, strength, pattern_match in self._pair_strengths(
+                semantic_meanings, candidates, pattern_strengths, 0.3
+            )
+        ]
+    
+    @staticmethod
+    def _pair_strengths(
+        semantic_meanings: List[SemanticMeaning],
+        candidates: List[Tuple[int, int]],
+        pattern_strengths: Dict[Tuple[int, int], float],
+        threshold: float
+    ) -> List[Tuple[int, int, float, float]]:
+        """
+        (i, j, strength, pattern match) for candidate pairs whose strength exceeds
+        threshold. Same arithmetic as _calculate_pairwise_relationship, run over
+        flat mask/domain lists so the pair loop does no method calls.
+        """
+        # Concept sets as bitmasks over the concepts seen in this call, so each
+        # pair's overlap is two popcounts
+        concept_bits: Dict[str, int] = {}
+        masks = []
+        for meaning in semantic_meanings:
+            mask = 0
+            for concept in meaning.concept_set:
+                bit = concept_bits.get(concept)
+                if bit is None:
+                    bit = concept_bits[concept] = len(concept_bits)
+                mask |= 1 << bit
+            masks.append(mask)
+        domains = [meaning.domain for meaning in semantic_meanings]
+        get_pattern = pattern_strengths.get
+        scored = []
+        for pair in candidates:
+            i, j = pair
+            mask1 = masks[i]
+            mask2 = masks[j]
+            if mask1 and mask2:
+                union = (mask1 | mask2).bit_count()
+                concept_overlap = (mask1 & mask2).bit_count() / union if union > 0 else 0.0
+            else:
+                concept_overlap = 0.0
+            pattern_match = get_pattern(pair, 0.0)
+            domain_bonus = 0.3 if domains[i] == domains[j] else 0.0
+            strength = (concept_overlap + pattern_match + domain_bonus) / 3.0
+            if strength > threshold:
+                scored.append((i, j, strength, pattern_match))
+        return scored
+    
+    def _prefilter_fields(self, names_lower: List[str]) -> List[Tuple[List[int], List[int]]]:
+        """Per two-sided relationship rule, the indices of names matching each side"""
+        return [
+            (
+                [i for i, name in enumerate(names_lower) if first_pattern.search(name)],
+                [j for j, name in enumerate(names_lower) if second_pattern.search(name)]
+            )
+            for first_pattern, second_pattern, _ in self._relationship_pattern_pairs
+        ]
+    
+    def _candidate_pairs(
+        self,
+        semantic_meanings: List[SemanticMeaning]
+    ) -> Tuple[List[Tuple[int, int]], Dict[Tuple[int, int], float]]:
+        """
+        Index pairs (i < j, in pair-loop order) that can clear the relationship
+        threshold, plus the relationship-pattern strength of every pair matching
+        a rule (first matching rule wins, as in _check_relationship_patterns).
+        Strength is the mean of concept overlap, pattern match and a 0.3
+        same-domain bonus, so a pair sharing no concept and matching no
+        relationship pattern scores at most 0.1 and is never worth evaluating.
+        Without the domain bonus the bar is higher still: a cross-domain pair
+        needs a shared concept, plus a relationship pattern or a near-total
+        concept overlap.
+        """
+        # Pairs matching a two-sided relationship pattern: each pattern runs once
+        # per field, then only the per-rule cross products are visited
+        pattern_pairs: Dict[Tuple[int, int], float] = {}
+        names_lower = [meaning.field_name.lower() for meaning in semantic_meanings]
+        prefilters = self._prefilter_fields(names_lower)
+        for (first, second), (_, _, strength) in zip(prefilters, self._relationship_pattern_pairs):
+            for i in first:
+                for j in second:
+                    if i != j:
+                        pattern_pairs.setdefault((i, j) if i < j else (j, i), strength)
+        
+        # Same-domain pattern pairs qualify on the bonus alone; cross-domain ones
+        # score (0.0 + pattern strength + 0.0) / 3 without a shared concept, which
+        # only the strongest rules can lift over the bar
+        cross_domain_patterns_qualify = self._max_pattern_strength / 3.0 > 0.3
+        candidates: Set[Tuple[int, int]] = {
+            (i, j) for (i, j), strength in pattern_pairs.items()
+            if semantic_meanings[i].domain == semantic_meanings[j].domain
+            or (cross_domain_patterns_qualify and strength / 3.0 > 0.3)
+        }
         
-        return relationships
+        # Pairs sharing a concept, via an inverted concept -> fields index
+        concept_index = defaultdict(list)
+        for i, meaning in enumerate(semantic_meanings):
+            for concept in meaning.concept_set:
+                concept_index[concept].append(i)
+        for indices in concept_index.values():
+            for position, i in enumerate(indices):
+                meaning1 = semantic_meanings[i]
+                for j in indices[position + 1:]:
+                    pair = (i, j)
+                    if pair in candidates:
+                        continue
+                    meaning2 = semantic_meanings[j]
+                    if meaning1.domain == meaning2.domain or pair in pattern_pairs:
+                        candidates.add(pair)
+                    elif self._calculate_concept_overlap(meaning1, meaning2) / 3.0 > 0.3:
+                        # Cross-domain with no pattern: overlap alone must clear the bar
+                        candidates.add(pair)
+        
+        return sorted(candidates), pattern_pairs
     
     def _calculate_pairwise_relationship(
         self,
         meaning1: SemanticMeaning,
-        meaning2: SemanticMeaning
+        meaning2: SemanticMeaning,
+        pattern_match: Optional[float] = None
     ) -> Optional[SemanticRelationship]:
-        """Calculate relationship strength between two semantic meanings"""
+        """
+        Calculate relationship strength between two semantic meanings.
+        
+        pattern_match may be supplied when the pair's relationship-pattern
+        strength is already known from prefiltering.
+        """
         # Same domain bonus
         domain_bonus = 0.3 if meaning1.domain == meaning2.domain else 0.0
         
@@ -374,7 +593,8 @@ class SemanticFieldGrouper:
         concept_overlap = self._calculate_concept_overlap(meaning1, meaning2)
         
         # Pattern matching
-        pattern_match = self._check_relationship_patterns(meaning1.field_name, meaning2.field_name)
+        if pattern_match is None:
+            pattern_match = self._check_relationship_patterns(meaning1.field_name, meaning2.field_name)
         
         # Calculate overall strength
         strength = (concept_overlap + pattern_match + domain_bonus) / 3.0
@@ -382,6 +602,16 @@ class SemanticFieldGrouper:
         if strength < 0.1:
             return None
         
+        return self._build_relationship(meaning1, meaning2, strength, pattern_match)
+    
+    def _build_relationship(
+        self,
+        meaning1: SemanticMeaning,
+        meaning2: SemanticMeaning,
+        strength: float,
+        pattern_match: float
+    ) -> SemanticRelationship:
+        """Create the relationship record for a scored pair"""
         # Determine relationship type
         relationship_type = self._determine_relationship_type(meaning1, meaning2, pattern_match)
         
@@ -406,6 +636,11 @@ class SemanticFieldGrouper:
             field_graph[rel.field1].append((rel.field2, rel.strength))
             field_graph[rel.field2].append((rel.field1, rel.strength))
         
+        # Relationship for each unordered field pair (the first one listed wins)
+        rel_index: Dict[frozenset, SemanticRelationship] = {}
+        for rel in relationships:
+            rel_index.setdefault(frozenset((rel.field1, rel.field2)), rel)
+        
         # Find connected components using DFS
         visited = set()
         groups = []
@@ -416,7 +651,7 @@ class SemanticFieldGrouper:
                 group_relationships = []
                 self._dfs_cluster(
                     meaning.field_name, field_graph, visited, 
-                    group_fields, group_relationships, relationships
+                    group_fields, group_relationships, rel_index
                 )
                 
                 if len(group_fields) > 1:  # Only create groups with multiple fields
@@ -434,22 +669,31 @@ class SemanticFieldGrouper:
         visited: Set[str],
         group_fields: List[str],
         group_relationships: List[SemanticRelationship],
-        all_relationships: List[SemanticRelationship]
+        rel_index: Dict[frozenset, SemanticRelationship]
     ):
         """Depth-first search for clustering fields"""
         visited.add(field)
         group_fields.append(field)
-        
-        for neighbor, strength in graph[field]:
-            if neighbor not in visited and strength > 0.5:  # Strong relationship threshold
-                # Find the relationship object
-                rel = next((r for r in all_relationships 
-                           if (r.field1 == field and r.field2 == neighbor) or
-                              (r.field1 == neighbor and r.field2 == field)), None)
-                if rel:
-                    group_relationships.append(rel)
-                
-                self._dfs_cluster(neighbor, graph, visited, group_fields, group_relationships, all_relationships)
+        # Explicit stack of (field, remaining neighbours) instead of recursion, so
+        # long relationship chains cannot hit the interpreter's recursion limit;
+        # visiting order matches the recursive walk
+        stack = [(field, iter(graph[field]))]
+        
+        while stack:
+            field, neighbors = stack[-1]
+            for neighbor, strength in neighbors:
+                if neighbor not in visited and strength > 0.5:  # Strong relationship threshold
+                    # Find the relationship object
+                    rel = rel_index.get(frozenset((field, neighbor)))
+                    if rel:
+                        group_relationships.append(rel)
+                    
+                    visited.add(neighbor)
+                    group_fields.append(neighbor)
+                    stack.append((neighbor, iter(graph[neighbor])))
+                    break
+            else:
+                stack.pop()
     
     def _create_field_group(
         self,
@@ -462,10 +706,7 @@ class SemanticFieldGrouper:
         group_meanings = [m for m in semantic_meanings if m.field_name in fields]
         
         # Determine dominant domain
-        domain_counts = defaultdict(int)
-        for meaning in group_meanings:
-            domain_counts[meaning.domain] += 1
-        dominant_domain = max(domain_counts.keys(), key=lambda d: domain_counts[d])
+        dominant_domain = Counter(m.domain for m in group_meanings).most_common(1)[0][0]
         
         # Generate group name and theme
         primary_concepts = [m.primary_concept for m in group_meanings]
@@ -476,7 +717,7 @@ class SemanticFieldGrouper:
         cohesion_score = self._calculate_group_cohesion(relationships, len(fields))
         
         return FieldGroup(
-            group_id=f"{dominant_domain.value}_{hash(tuple(sorted(fields))) % 10000}",
+            group_id=f"{dominant_domain.value}_{self._group_digest(fields)}",
             group_name=group_name,
             fields=fields,
             semantic_theme=semantic_theme,
@@ -485,6 +726,15 @@ class SemanticFieldGrouper:
             relationships=relationships
         )
     
+    @staticmethod
+    def _group_digest(fields: List[str]) -> str:
+        """Stable identifier for a set of field names (independent of hash seed and order)"""
+        digest = hashlib.blake2b(digest_size=6)
+        for name in sorted(fields):
+            digest.update(name.encode())
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
     def _refine_groups_with_domain_rules(
         self,
         groups: List[FieldGroup],
@@ -511,17 +761,22 @@ class SemanticFieldGrouper:
         concepts = []
         
         # Split by common separators
-        parts = re.split(r'[_\-\s]+', name.lower())
+        name_lower = name.lower()
+        parts = self._NAME_SEPARATOR_RX.split(name_lower)
         
         # Match against semantic patterns
-        for domain, patterns in self._semantic_patterns.items():
-            for pattern in patterns:
-                if any(re.search(pattern, part) for part in parts):
-                    concepts.append(domain)
-                    break
-        
-        # Add specific concepts from parts
-        concepts.extend([part for part in parts if len(part) > 2])
+        matched_categories: Set[int] = set()
+        self._name_pattern_automaton.scan(0, (name_lower.encode(),), matched_categories)
+        residual_patterns = self._residual_name_patterns
+        for category_id, category in enumerate(self._name_pattern_categories):
+            if category_id in matched_categories or (
+                    category in residual_patterns
+                    and any(residual_patterns[category].search(part) for part in parts)):
+                concepts.append(category)
+        
+        # Add specific concepts from parts (interned: concepts are compared and
+        # hashed across every field pair downstream)
+        concepts.extend([sys.intern(part) for part in parts if len(part) > 2])
         
         return list(set(concepts))
     
@@ -532,14 +787,11 @@ class SemanticFieldGrouper:
         if not description:
             return concepts
         
-        description_lower = description.lower()
-        
-        # Match against domain vocabularies
-        for domain, vocab in self._domain_vocabularies.items():
-            for category, terms in vocab.items():
-                for term in terms:
-                    if term in description_lower:
-                        concepts.append(f"{domain.value}_{category}")
+        # Match against domain vocabularies: one concept per term found, in
+        # vocabulary order
+        matched_terms: Set[int] = set()
+        self._vocab_automaton.scan(0, (description.lower().encode(),), matched_terms)
+        concepts.extend(self._vocab_concepts[term_id] for term_id in sorted(matched_terms))
         
         return concepts
     
@@ -561,12 +813,8 @@ class SemanticFieldGrouper:
             if domain_concepts:
                 return domain_concepts[0]
         
-        # Return most frequent concept
-        concept_counts = defaultdict(int)
-        for concept in all_concepts:
-            concept_counts[concept] += 1
-        
-        return max(concept_counts.keys(), key=lambda c: concept_counts[c])
+        # Return most frequent concept (first seen wins ties)
+        return Counter(all_concepts).most_common(1)[0][0]
     
     def _identify_secondary_concepts(
         self,
@@ -585,12 +833,21 @@ class SemanticFieldGrouper:
         domain: Optional[SemanticDomain]
     ) -> str:
         """Categorize the semantic meaning"""
+        return self._categorize_concept(primary_concept, domain)
+    
+    def _categorize_concept_uncached(
+        self,
+        primary_concept: str,
+        domain: Optional[SemanticDomain]
+    ) -> str:
+        """Categorize a primary concept within a domain"""
         if domain:
-            # Use domain-specific categorization
-            domain_vocab = self._domain_vocabularies.get(domain, {})
-            for category, terms in domain_vocab.items():
-                if any(term in primary_concept.lower() for term in terms):
-                    return f"{domain.value}_{category}"
+            # Use domain-specific categorization: the first category (in vocabulary
+            # order) with a term inside the concept
+            concept_lower = primary_concept.lower()
+            for term, category_label in self._term_to_category.get(domain, ()):
+                if term in concept_lower:
+                    return category_label
         
         # Fallback to general categorization
         if any(pattern in primary_concept for pattern in ["id", "number", "code"]):
@@ -606,7 +863,8 @@ class SemanticFieldGrouper:
     
     def _calculate_semantic_confidence(
         self,
-        field: FieldDefinition,
+        semantic_domain: Optional[SemanticDomain],
+        has_semantic_meaning: bool,
         primary_concept: str,
         secondary_concepts: List[str]
     ) -> float:
@@ -614,7 +872,7 @@ class SemanticFieldGrouper:
         confidence = 0.5  # Base confidence
         
         # Boost for clear semantic domain assignment
-        if field.semantic_domain:
+        if semantic_domain:
             confidence += 0.2
         
         # Boost for meaningful primary concept
@@ -625,7 +883,7 @@ class SemanticFieldGrouper:
         confidence += min(len(secondary_concepts) * 0.1, 0.3)
         
         # Boost for semantic meaning field
-        if field.semantic_meaning:
+        if has_semantic_meaning:
             confidence += 0.2
         
         return min(confidence, 1.0)
@@ -637,7 +895,7 @@ class SemanticFieldGrouper:
         # Naming patterns
         if '_' in name:
             patterns.append("underscore_separated")
-        if re.search(r'[A-Z]', name):
+        if self._UPPERCASE_RX.search(name):
             patterns.append("camel_case")
         if name.endswith('_code'):
             patterns.append("code_suffix")
@@ -648,7 +906,7 @@ class SemanticFieldGrouper:
         if description:
             if '(' in description and ')' in description:
                 patterns.append("parenthetical_info")
-            if re.search(r'\d+', description):
+            if self._DIGITS_RX.search(description):
                 patterns.append("numeric_specification")
         
         return patterns
@@ -665,34 +923,41 @@ class SemanticFieldGrouper:
             "stability_analysis": {}
         }
         
-        # Track field appearances across versions
-        field_appearances = defaultdict(list)
+        # Track first/last appearance and count per field in one pass, rather than
+        # collecting every version id and reducing each list afterwards
+        field_appearances: Dict[str, List[Any]] = {}
         for version_id, fields in version_field_map.items():
             for field in fields:
-                field_appearances[field.name].append(version_id)
+                appearance = field_appearances.get(field.name)
+                if appearance is None:
+                    field_appearances[field.name] = [version_id, version_id, 1]
+                else:
+                    if version_id < appearance[0]:
+                        appearance[0] = version_id
+                    elif version_id > appearance[1]:
+                        appearance[1] = version_id
+                    appearance[2] += 1
         
         # Analyze field lifecycle
-        for field_name, versions in field_appearances.items():
+        stable_threshold = len(version_field_map) * 0.7
+        for field_name, (first, last, count) in field_appearances.items():
             evolution_patterns["field_lifecycle"][field_name] = {
-                "first_appearance": min(versions),
-                "last_appearance": max(versions),
-                "total_versions": len(versions),
-                "stability": "stable" if len(versions) > len(version_field_map) * 0.7 else "volatile"
+                "first_appearance": first,
+                "last_appearance": last,
+                "total_versions": count,
+                "stability": "stable" if count > stable_threshold else "volatile"
             }
         
         return evolution_patterns
     
     def _identify_domain_semantic_themes(
         self,
-        fields: List[FieldDefinition],
+        semantic_meanings: List[SemanticMeaning],
         domain: SemanticDomain
     ) -> List[Dict[str, Any]]:
         """Identify semantic themes within a domain"""
         themes = []
         
-        # Extract all semantic meanings
-        semantic_meanings = [self.extract_semantic_meaning(field) for field in fields]
-        
         # Group by primary concepts
         concept_groups = defaultdict(list)
         for meaning in semantic_meanings:
@@ -706,11 +971,11 @@ class SemanticFieldGrouper:
                     "field_count": len(meanings),
                     "fields": [m.field_name for m in meanings],
                     "semantic_categories": list(set(m.semantic_category for m in meanings)),
-                    "average_confidence": sum(m.confidence for m in meanings) / len(meanings)
+                    "average_confidence": sum(map(_confidence, meanings)) / len(meanings)
                 }
                 themes.append(theme)
         
-        return sorted(themes, key=lambda t: t["field_count"], reverse=True)
+        return sorted(themes, key=itemgetter("field_count"), reverse=True)
     
     def _analyze_domain_naming_conventions(
         self,
@@ -718,70 +983,68 @@ class SemanticFieldGrouper:
         domain: SemanticDomain
     ) -> Dict[str, Any]:
         """Analyze naming conventions within a domain"""
-        conventions = {
-            "common_prefixes": defaultdict(int),
-            "common_suffixes": defaultdict(int),
-            "separator_patterns": defaultdict(int),
-            "length_distribution": defaultdict(int)
-        }
+        prefixes = Counter()
+        suffixes = Counter()
+        separators = Counter()
+        length_buckets = Counter()
         
         for field in fields:
             name = field.name
+            length = len(name)
             
-            # Analyze prefixes (first 3-5 characters)
-            if len(name) > 3:
-                conventions["common_prefixes"][name[:3]] += 1
-            if len(name) > 5:
-                conventions["common_prefixes"][name[:5]] += 1
-            
-            # Analyze suffixes
-            if len(name) > 4:
-                conventions["common_suffixes"][name[-4:]] += 1
-            if len(name) > 6:
-                conventions["common_suffixes"][name[-6:]] += 1
+            # Analyze prefixes (first 3-5 characters) and suffixes
+            if length > 3:
+                prefixes[name[:3]] += 1
+                if length > 4:
+                    suffixes[name[-4:]] += 1
+                    if length > 5:
+                        prefixes[name[:5]] += 1
+                        if length > 6:
+                            suffixes[name[-6:]] += 1
             
             # Analyze separators
             if '_' in name:
-                conventions["separator_patterns"]["underscore"] += 1
+                separators["underscore"] += 1
             if '-' in name:
-                conventions["separator_patterns"]["hyphen"] += 1
+                separators["hyphen"] += 1
             
-            # Length distribution
-            length_category = f"{(len(name) // 5) * 5}-{(len(name) // 5) * 5 + 4}"
-            conventions["length_distribution"][length_category] += 1
+            # Length distribution, counted by bucket start and labelled below
+            length_buckets[length // 5] += 1
         
-        # Convert to regular dicts and sort
+        # Convert to regular dicts, keeping the five most common affixes
         return {
-            "common_prefixes": dict(sorted(conventions["common_prefixes"].items(), 
-                                         key=lambda x: x[1], reverse=True)[:5]),
-            "common_suffixes": dict(sorted(conventions["common_suffixes"].items(), 
-                                         key=lambda x: x[1], reverse=True)[:5]),
-            "separator_patterns": dict(conventions["separator_patterns"]),
-            "length_distribution": dict(conventions["length_distribution"])
+            "common_prefixes": dict(nlargest(5, prefixes.items(), key=itemgetter(1))),
+            "common_suffixes": dict(nlargest(5, suffixes.items(), key=itemgetter(1))),
+            "separator_patterns": dict(separators),
+            "length_distribution": {
+                f"{bucket * 5}-{bucket * 5 + 4}": count for bucket, count in length_buckets.items()
+            }
         }
     
     def _calculate_domain_cohesion(
         self,
-        fields: List[FieldDefinition],
+        semantic_meanings: List[SemanticMeaning],
         domain: SemanticDomain
     ) -> Dict[str, float]:
         """Calculate cohesion metrics for a domain"""
-        if not fields:
+        if not semantic_meanings:
             return {"consistency_score": 0.0, "semantic_cohesion": 0.0}
         
-        # Extract semantic meanings
-        semantic_meanings = [self.extract_semantic_meaning(field) for field in fields]
-        
         # Calculate semantic consistency
         primary_concepts = [m.primary_concept for m in semantic_meanings]
         concept_diversity = len(set(primary_concepts)) / len(primary_concepts) if primary_concepts else 0
         consistency_score = 1.0 - concept_diversity  # Lower diversity = higher consistency
         
-        # Calculate semantic cohesion based on relationships
-        relationships = self._calculate_semantic_relationships(semantic_meanings)
-        if len(fields) > 1:
-            max_possible_relationships = len(fields) * (len(fields) - 1) / 2
-            actual_relationships = len([r for r in relationships if r.strength > 0.5])
+        # Calculate semantic cohesion based on strong relationships; only their
+        # count matters, so pairs are scored without building relationship
+        # records, and a lone field is cohesive without scoring anything
+        field_count = len(semantic_meanings)
+        if field_count > 1:
+            max_possible_relationships = field_count * (field_count - 1) / 2
+            candidates, pattern_strengths = self._candidate_pairs(semantic_meanings)
+            actual_relationships = len(self._pair_strengths(
+                semantic_meanings, candidates, pattern_strengths, 0.5
+            ))
             semantic_cohesion = actual_relationships / max_possible_relationships
         else:
             semantic_cohesion = 1.0
@@ -789,7 +1052,7 @@ class SemanticFieldGrouper:
         return {
             "consistency_score": consistency_score,
             "semantic_cohesion": semantic_cohesion,
-            "average_confidence": sum(m.confidence for m in semantic_meanings) / len(semantic_meanings)
+            "average_confidence": sum(map(_confidence, semantic_meanings)) / len(semantic_meanings)
         }
     
     def _identify_field_dependencies(
@@ -800,41 +1063,60 @@ class SemanticFieldGrouper:
         """Identify dependencies between fields in a domain"""
         dependencies = []
         
-        # Check for coordinate pairs
-        lat_fields = [f for f in fields if 'lat' in f.name.lower()]
-        lon_fields = [f for f in fields if 'lon' in f.name.lower()]
+        # Sort field names into coordinate and measurement roles in one pass,
+        # lowering each name once
+        lat_names = []
+        lon_names = []
+        measurement_names = []
+        measurement_search = self._MEASUREMENT_NAME_RX.search
+        for f in fields:
+            name = f.name
+            name_lower = name.lower()
+            if 'lat' in name_lower:
+                lat_names.append(name)
+            if 'lon' in name_lower:
+                lon_names.append(name)
+            if measurement_search(name_lower):
+                measurement_names.append(name)
         
-        for lat_field in lat_fields:
-            for lon_field in lon_fields:
+        # Check for coordinate pairs
+        for lat_name in lat_names:
+            for lon_name in lon_names:
                 dependencies.append({
                     "type": "coordinate_pair",
-                    "fields": [lat_field.name, lon_field.name],
+                    "fields": [lat_name, lon_name],
                     "dependency_strength": 0.9,
                     "description": "Latitude and longitude form coordinate pairs"
                 })
         
         # Check for measurement groups
-        measurement_fields = [f for f in fields if any(term in f.name.lower() 
-                                                     for term in ['length', 'weight', 'score'])]
-        if len(measurement_fields) > 1:
+        if len(measurement_names) > 1:
             dependencies.append({
                 "type": "measurement_group",
-                "fields": [f.name for f in measurement_fields],
+                "fields": measurement_names,
                 "dependency_strength": 0.7,
                 "description": "Related biometric measurements"
             })
         
         return dependencies
     
+    @staticmethod
+    def _field_version_counts(
+        version_field_map: Dict[str, List[FieldDefinition]]
+    ) -> Counter:
+        """Count field name occurrences across the versions of a field map"""
+        return Counter(
+            field.name for fields in version_field_map.values() for field in fields
+        )
+    
     def _find_most_stable_fields(
         self,
-        version_field_map: Dict[str, List[FieldDefinition]]
+        version_field_map: Dict[str, List[FieldDefinition]],
+        field_counts: Optional[Counter] = None
     ) -> List[str]:
         """Find fields that appear in most versions (most stable)"""
-        field_counts = defaultdict(int)
-        for fields in version_field_map.values():
-            for field in fields:
-                field_counts[field.name] += 1
+        if field_counts is None:
+            field_counts = self._field_version_counts(version_field_map)
         
         total_versions = len(version_field_map)
         stable_fields = [field for field, count in field_counts.items() 
@@ -844,13 +1126,12 @@ class SemanticFieldGrouper:
     
     def _find_most_volatile_fields(
         self,
-        version_field_map: Dict[str, List[FieldDefinition]]
+        version_field_map: Dict[str, List[FieldDefinition]],
+        field_counts: Optional[Counter] = None
     ) -> List[str]:
         """Find fields that appear in few versions (most volatile)"""
-        field_counts = defaultdict(int)
-        for fields in version_field_map.values():
-            for field in fields:
-                field_counts[field.name] += 1
+        if field_counts is None:
+            field_counts = self._field_version_counts(version_field_map)
         
         volatile_fields = [field for field, count in field_counts.items() 
                           if count == 1]  # Appear in only one version
@@ -863,8 +1144,8 @@ class SemanticFieldGrouper:
         meaning2: SemanticMeaning
     ) -> float:
         """Calculate concept overlap between two semantic meanings"""
-        concepts1 = set([meaning1.primary_concept] + meaning1.secondary_concepts)
-        concepts2 = set([meaning2.primary_concept] + meaning2.secondary_concepts)
+        concepts1 = meaning1.concept_set
+        concepts2 = meaning2.concept_set
         
         if not concepts1 or not concepts2:
             return 0.0
@@ -879,15 +1160,10 @@ class SemanticFieldGrouper:
         field1_lower = field1.lower()
         field2_lower = field2.lower()
         
-        for rule in self._relationship_rules:
-            patterns = rule["pattern"]
-            if len(patterns) == 2:
-                if (any(re.search(patterns[0], field1_lower) for p in [patterns[0]]) and
-                    any(re.search(patterns[1], field2_lower) for p in [patterns[1]])):
-                    return rule["strength"]
-                if (any(re.search(patterns[1], field1_lower) for p in [patterns[1]]) and
-                    any(re.search(patterns[0], field2_lower) for p in [patterns[0]])):
-                    return rule["strength"]
+        for first_pattern, second_pattern, strength in self._relationship_pattern_pairs:
+            if ((first_pattern.search(field1_lower) and second_pattern.search(field2_lower)) or
+                    (second_pattern.search(field1_lower) and first_pattern.search(field2_lower))):
+                return strength
         
         return 0.0
     
@@ -916,39 +1192,43 @@ class SemanticFieldGrouper:
         if field_count < 2:
             return 1.0
         
-        max_possible_relationships = field_count * (field_count - 1) / 2
+        # field_count >= 2 here, so there is at least one possible pair
+        max_possible_relationships = field_count * (field_count - 1) // 2
         actual_relationships = len(relationships)
         
-        if max_possible_relationships == 0:
-            return 1.0
-        
         relationship_density = actual_relationships / max_possible_relationships
-        average_strength = sum(r.strength for r in relationships) / len(relationships) if relationships else 0
+        average_strength = (
+            sum(map(attrgetter("strength"), relationships)) / max(1, actual_relationships)
+        )
         
         return (relationship_density + average_strength) / 2.0
     
     def _generate_group_name(self, concepts: List[str], domain: SemanticDomain) -> str:
         """Generate a descriptive name for a field group"""
         # Find most common concept
-        concept_counts = defaultdict(int)
-        for concept in concepts:
-            concept_counts[concept] += 1
-        
-        if concept_counts:
-            primary_concept = max(concept_counts.keys(), key=lambda c: concept_counts[c])
+        if concepts:
+            primary_concept = Counter(concepts).most_common(1)[0][0]
             return f"{domain.value}_{primary_concept}_group"
         else:
             return f"{domain.value}_group"
     
     def _generate_semantic_theme(self, meanings: List[SemanticMeaning]) -> str:
         """Generate a semantic theme description for a group"""
-        categories = [m.semantic_category for m in meanings]
-        primary_concepts = [m.primary_concept for m in meanings]
-        
-        if len(set(categories)) == 1:
-            return f"Fields related to {categories[0]}"
-        elif len(set(primary_concepts)) <= 2:
-            return f"Fields involving {' and '.join(set(primary_concepts))}"
+        return self._semantic_theme(
+            frozenset([m.semantic_category for m in meanings]),
+            frozenset([m.primary_concept for m in meanings])
+        )
+    
+    @staticmethod
+    def _semantic_theme_uncached(
+        categories: FrozenSet[str],
+        primary_concepts: FrozenSet[str]
+    ) -> str:
+        """Theme description for a group's distinct categories and primary concepts"""
+        if len(categories) == 1:
+            return f"Fields related to {next(iter(categories))}"
+        elif len(primary_concepts) <= 2:
+            return f"Fields involving {' and '.join(primary_concepts)}"
         else:
             return "Semantically related fields"
     
@@ -973,17 +1253,18 @@ class SemanticFieldGrouper:
         domain: SemanticDomain
     ) -> Dict[str, List[str]]:
         """Create domain-specific subcategories"""
-        subcategories = defaultdict(list)
+        subcategories: Dict[str, List[str]] = {}
+        
+        # Only include patterns with multiple fields: tally first, so no list is
+        # allocated for a one-off pattern
+        pattern_counts = Counter(
+            pattern for meaning in semantic_meanings for pattern in meaning.linguistic_patterns
+        )
         
         # Group by linguistic patterns
-        pattern_groups = defaultdict(list)
         for meaning in semantic_meanings:
             for pattern in meaning.linguistic_patterns:
-                pattern_groups[f"pattern_{pattern}"].append(meaning.field_name)
-        
-        # Only include patterns with multiple fields
-        for pattern, fields in pattern_groups.items():
-            if len(fields) > 1:
-                subcategories[pattern] = fields
+                if pattern_counts[pattern] > 1:
+                    subcategories.setdefault(f"pattern_{pattern}", []).append(meaning.field_name)
         
-        return dict(subcategories)
\ No newline at end of file
+        return subcategories
\ No newline at end of file
@@ -1,14 +1,22 @@
 """
 SKOS Manager implementation for EURING Code Recognition System
 """
+import asyncio
 import json
 import os
-from typing import Dict, List, Optional, Any
+import re
+from collections import Counter
+from enum import Enum
+from itertools import chain
+from operator import attrgetter
+from typing import Dict, List, Optional, Any, Set, Tuple
 from pathlib import Path
 from ..models.euring_models import (
     EuringVersionModel, EuringVersion, VersionRelationship, 
     ConversionMapping, FieldDefinition, ValidationRule, FormatSpec,
-    SemanticDomain, DomainEvolution, DomainCompatibilityMatrix
+    SemanticDomain, DomainEvolution, DomainCompatibilityMatrix,
+    SemanticDomainMapping, CompatibilityLevel, FieldMapping, DomainEvolutionEntry,
+    DomainConversionMapping
 )
 from .interfaces import SKOSManager, VersionCharacteristics, ConversionRules
 from ..repositories.skos_repository import SKOSRepository
@@ -16,35 +24,123 @@ from .domain_compatibility_assessor import DomainCompatibilityAssessor
 from .domain_conversion_service import DomainConversionService
 
 
+# Compatibility score reported for each conversion mapping compatibility level
+_COMPATIBILITY_SCORES: Dict[CompatibilityLevel, float] = {
+    CompatibilityLevel.FULL: 1.0,
+    CompatibilityLevel.PARTIAL: 0.7,
+    CompatibilityLevel.LIMITED: 0.4,
+    CompatibilityLevel.NONE: 0.0
+}
+
+# Semantic domains in declaration order; enum iteration goes through EnumMeta
+_SEMANTIC_DOMAINS = tuple(SemanticDomain)
+
+_entry_year = attrgetter("year")
+
+
+def _field_mapping_dict(
+    field_mapping: FieldMapping,
+    extra: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Serialize a field mapping with its accuracy, followed by any extra keys"""
+    mapping_dict = {
+        "source_field": field_mapping.source_field,
+        "target_field": field_mapping.target_field,
+        "transformation_type": field_mapping.transformation_type.value,
+        "transformation_function": field_mapping.transformation_function,
+        "conversion_accuracy": field_mapping.conversion_accuracy
+    }
+    if extra:
+        mapping_dict.update(extra)
+    return mapping_dict
+
+
 class SKOSManagerImpl(SKOSManager):
     """Concrete implementation of SKOS Manager for EURING versions"""
     
     def __init__(self, data_directory: str = "data/euring_versions"):
         self.repository = SKOSRepository(data_directory)
         self._version_model: Optional[EuringVersionModel] = None
+        # Set once a model is in place; the per-call guard only reads this flag
+        self._loaded = False
         self._version_cache: Dict[str, EuringVersion] = {}
+        # Version id -> position in the model's version list
+        self._version_index: Dict[str, int] = {}
+        # Memoized results, dropped whenever the versions or mappings they were
+        # built from change
+        self._version_characteristics_cache: Dict[str, VersionCharacteristics] = {}
+        self._conversion_rules_cache: Dict[Tuple[str, str], ConversionRules] = {}
+        # (from_version, to_version) -> mappings for that pair, in model order
+        self._conversion_mapping_index: Dict[Tuple[str, str], List[ConversionMapping]] = {}
+        # Version pairs with at least one mapping whose compatibility is not "none"
+        self._compatible_pairs: Set[Tuple[str, str]] = set()
+        # Domain lookups over lists that the version loader may replace after
+        # load, so each index remembers the list it was built from
+        self._domain_evolution_index: Tuple[Optional[list], Dict[SemanticDomain, DomainEvolution]] = (None, {})
+        self._semantic_domain_index: Dict[
+            str, Tuple[Optional[list], Dict[SemanticDomain, SemanticDomainMapping]]
+        ] = {}
+        self._sorted_evolution_entries: Dict[
+            SemanticDomain, Tuple[list, int, Tuple[DomainEvolutionEntry, ...]]
+        ] = {}
+        # (from_version, to_version) -> the mapping's field mappings and domain
+        # mappings grouped by domain, with the lists they were grouped from
+        self._conversion_domain_index: Dict[
+            Tuple[str, str],
+            Tuple[
+                ConversionMapping, list, Optional[list],
+                Dict[Optional[SemanticDomain], List[FieldMapping]],
+                Dict[SemanticDomain, DomainConversionMapping]
+            ]
+        ] = {}
         self._domain_compatibility_assessor = DomainCompatibilityAssessor()
         self._domain_conversion_service = DomainConversionService()
+        # Resolves to the model while a load is in flight, so concurrent callers
+        # share one load instead of each reading every file
+        self._load_future: Optional[asyncio.Future] = None
     async def load_version_model(self) -> EuringVersionModel:
         """Load the complete EURING version model from data files"""
         if self._version_model is not None:
             return self._version_model
-            
+        
+        if self._load_future is not None:
+            return await asyncio.shield(self._load_future)
+        
+        load_future = self._load_future = asyncio.get_running_loop().create_future()
+        try:
+            version_model = await self._load_version_model_from_repository()
+        except asyncio.CancelledError:
+            load_future.cancel()
+            raise
+        except BaseException as e:
+            load_future.set_exception(e)
+            # Waiters re-raise it; don't report it as never retrieved
+            load_future.exception()
+            raise
+        else:
+            load_future.set_result(version_model)
+            return version_model
+        finally:
+            self._load_future = None
+    
+    async def _load_version_model_from_repository(self) -> EuringVersionModel:
+        """Read the version model from the repository and rebuild derived state"""
         # Load versions from repository
         versions = await self.repository.load_all_versions()
         relationships = await self.repository.load_relationships()
         conversion_mappings = await self.repository.load_conversion_mappings()
         
-        # Load domain evolutions if available
-        domain_evolutions = []
-        for domain in SemanticDomain:
-            try:
-                domain_evolution = await self.repository.load_domain_evolution(domain)
-                if domain_evolution:
-                    domain_evolutions.append(domain_evolution)
-            except Exception:
-                # Domain evolution not available, skip
-                pass
+        # Load domain evolutions if available; domains are independent, so their
+        # loads are awaited together
+        results = await asyncio.gather(
+            *(self.repository.load_domain_evolution(domain) for domain in SemanticDomain),
+            return_exceptions=True
+        )
+        # Domain evolution not available (missing or failed to load), skip
+        domain_evolutions = [
+            domain_evolution for domain_evolution in results
+            if domain_evolution and not isinstance(domain_evolution, BaseException)
+        ]
         
         self._version_model = EuringVersionModel(
             versions=versions,
@@ -53,8 +149,18 @@ class SKOSManagerImpl(SKOSManager):
             domain_evolutions=domain_evolutions
         )
         
-        # Cache versions for quick access
+        # Cache versions and conversion mappings for quick access
         self._version_cache = {v.id: v for v in versions}
+        self._version_index = {}
+        for i, v in enumerate(versions):
+            self._version_index.setdefault(v.id, i)
+        self._conversion_mapping_index = {}
+        self._conversion_domain_index = {}
+        self._compatible_pairs = set()
+        for mapping in conversion_mappings:
+            self._index_conversion_mapping(mapping)
+        self._version_characteristics_cache.clear()
+        self._conversion_rules_cache.clear()
         
         # Initialize domain compatibility assessor
         self._domain_compatibility_assessor.load_versions(versions)
@@ -64,13 +170,111 @@ class SKOSManagerImpl(SKOSManager):
         # Initialize domain conversion service
         self._domain_conversion_service.load_versions(versions)
         
+        self._loaded = True
         return self._version_model
     
+    def _index_conversion_mapping(self, mapping: ConversionMapping) -> None:
+        """Add a conversion mapping to the (from_version, to_version) index"""
+        key = (mapping.from_version, mapping.to_version)
+        self._conversion_mapping_index.setdefault(key, []).append(mapping)
+        if mapping.compatibility_level != CompatibilityLevel.NONE:
+            self._compatible_pairs.add(key)
+    
+    def _find_conversion_mapping(self, from_version: str, to_version: str) -> Optional[ConversionMapping]:
+        """First conversion mapping from one version to another, if any"""
+        mappings = self._conversion_mapping_index.get((from_version, to_version))
+        return mappings[0] if mappings else None
+    
+    def _conversion_mapping_domains(
+        self,
+        conversion_mapping: ConversionMapping
+    ) -> Tuple[Dict[Optional[SemanticDomain], List[FieldMapping]], Dict[SemanticDomain, DomainConversionMapping]]:
+        """A conversion mapping's field mappings and first domain mapping, keyed by domain"""
+        key = (conversion_mapping.from_version, conversion_mapping.to_version)
+        field_mappings = conversion_mapping.field_mappings
+        domain_mappings = conversion_mapping.domain_mappings
+        cached = self._conversion_domain_index.get(key)
+        if (
+            cached is not None
+            and cached[0] is conversion_mapping
+            and cached[1] is field_mappings
+            and cached[2] is domain_mappings
+        ):
+            return cached[3], cached[4]
+        
+        fields_by_domain: Dict[Optional[SemanticDomain], List[FieldMapping]] = {}
+        for field_mapping in field_mappings:
+            fields_by_domain.setdefault(field_mapping.semantic_domain, []).append(field_mapping)
+        domain_mapping_by_domain: Dict[SemanticDomain, DomainConversionMapping] = {}
+        for domain_mapping in domain_mappings or ():
+            domain_mapping_by_domain.setdefault(domain_mapping.domain, domain_mapping)
+        self._conversion_domain_index[key] = (
+            conversion_mapping, field_mappings, domain_mappings,
+            fields_by_domain, domain_mapping_by_domain
+        )
+        return fields_by_domain, domain_mapping_by_domain
+    
+    def _find_domain_evolution(self, domain: SemanticDomain) -> Optional[DomainEvolution]:
+        """First loaded evolution for a domain, if any"""
+        evolutions = self._version_model.domain_evolutions
+        source, index = self._domain_evolution_index
+        if source is not evolutions:
+            index = {}
+            for evolution in evolutions or ():
+                index.setdefault(evolution.domain, evolution)
+            self._domain_evolution_index = (evolutions, index)
+        return index.get(domain)
+    
+    def _sorted_evolution_entries_for(
+        self,
+        domain_evolution: DomainEvolution
+    ) -> Tuple[DomainEvolutionEntry, ...]:
+        """A domain's evolution entries ordered by year, sorted once per entry list"""
+        entries = domain_evolution.evolution_entries
+        source, size, ordered = self._sorted_evolution_entries.get(domain_evolution.domain, (None, 0, ()))
+        if source is not entries or size != len(entries):
+            ordered = tuple(sorted(entries, key=_entry_year))
+            self._sorted_evolution_entries[domain_evolution.domain] = (entries, len(entries), ordered)
+        return ordered
+    
+    def _find_semantic_domain_mapping(
+        self,
+        euring_version: EuringVersion,
+        domain: SemanticDomain
+    ) -> Optional[SemanticDomainMapping]:
+        """First semantic domain mapping of a version for a domain, if any"""
+        mappings = euring_version.semantic_domains
+        source, index = self._semantic_domain_index.get(euring_version.id, (None, None))
+        if index is None or source is not mappings:
+            index = {}
+            for mapping in mappings or ():
+                index.setdefault(mapping.domain, mapping)
+            self._semantic_domain_index[euring_version.id] = (mappings, index)
+        return index.get(domain)
+    
+    def _invalidate_version_results(self, version_id: str) -> None:
+        """Drop memoized results derived from a version"""
+        self._version_characteristics_cache.pop(version_id, None)
+        for key in [key for key in self._conversion_rules_cache if version_id in key]:
+            del self._conversion_rules_cache[key]
+    
     async def get_version_characteristics(self, version: str) -> VersionCharacteristics:
         """Get characteristics for a specific version"""
-        if not self._version_model:
-            await self.load_version_model()
-            
+        await self._ensure_loaded()
+        
+        characteristics = self._version_characteristics_cache.get(version)
+        if characteristics is None:
+            characteristics = self._build_version_characteristics(version)
+            self._version_characteristics_cache[version] = characteristics
+        
+        # Callers get their own lists; the cached instance must stay unchanged
+        return characteristics.model_copy(update={
+            'unique_patterns': list(characteristics.unique_patterns),
+            'validation_rules': list(characteristics.validation_rules)
+        })
+    
+    def _build_version_characteristics(self, version: str) -> VersionCharacteristics:
+        """Characteristics of a loaded version, computed from its definitions"""
         if version not in self._version_cache:
             raise ValueError(f"Version {version} not found")
             
@@ -95,28 +299,37 @@ class SKOSManagerImpl(SKOSManager):
     
     async def get_conversion_rules(self, from_version: str, to_version: str) -> ConversionRules:
         """Get conversion rules between two versions"""
-        if not self._version_model:
-            await self.load_version_model()
-            
+        await self._ensure_loaded()
+        
+        rules = self._conversion_rules_cache.get((from_version, to_version))
+        if rules is None:
+            rules = self._build_conversion_rules(from_version, to_version)
+            self._conversion_rules_cache[(from_version, to_version)] = rules
+        
+        # Callers get their own lists and mapping dicts; the cached instance must stay unchanged
+        return rules.model_copy(update={
+            'field_mappings': [dict(field_mapping) for field_mapping in rules.field_mappings],
+            'transformation_functions': list(rules.transformation_functions)
+        })
+    
+    def _build_conversion_rules(self, from_version: str, to_version: str) -> ConversionRules:
+        """Conversion rules between two loaded versions, computed from their conversion mapping"""
         # Find conversion mapping
-        conversion_mapping = None
-        for mapping in self._version_model.conversion_mappings:
-            if mapping.from_version == from_version and mapping.to_version == to_version:
-                conversion_mapping = mapping
-                break
-                
+        conversion_mapping = self._find_conversion_mapping(from_version, to_version)
+        
         if not conversion_mapping:
             raise ValueError(f"No conversion mapping found from {from_version} to {to_version}")
         
         # Extract field mappings as dictionaries
-        field_mappings = []
-        for field_mapping in conversion_mapping.field_mappings:
-            field_mappings.append({
+        field_mappings = [
+            {
                 "source_field": field_mapping.source_field,
                 "target_field": field_mapping.target_field,
                 "transformation_type": field_mapping.transformation_type.value,
                 "transformation_function": field_mapping.transformation_function
-            })
+            }
+            for field_mapping in conversion_mapping.field_mappings
+        ]
         
         # Extract transformation functions
         transformation_functions = [
@@ -125,14 +338,8 @@ class SKOSManagerImpl(SKOSManager):
         ]
         
         # Calculate compatibility score based on compatibility level
-        compatibility_scores = {
-            "full": 1.0,
-            "partial": 0.7,
-            "limited": 0.4,
-            "none": 0.0
-        }
-        compatibility_score = compatibility_scores.get(
-            conversion_mapping.compatibility_level.value, 0.0
+        compatibility_score = _COMPATIBILITY_SCORES.get(
+            conversion_mapping.compatibility_level, 0.0
         )
         
         return ConversionRules(
@@ -145,26 +352,18 @@ class SKOSManagerImpl(SKOSManager):
     
     async def validate_version_compatibility(self, from_version: str, to_version: str) -> bool:
         """Check if conversion between versions is possible"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         # Check if both versions exist
         if from_version not in self._version_cache or to_version not in self._version_cache:
             return False
             
         # Check if conversion mapping exists
-        for mapping in self._version_model.conversion_mappings:
-            if (mapping.from_version == from_version and 
-                mapping.to_version == to_version and
-                mapping.compatibility_level.value != "none"):
-                return True
-                
-        return False
+        return (from_version, to_version) in self._compatible_pairs
     
     async def add_version(self, version: EuringVersion) -> None:
         """Add a new version to the model"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         # Check if version already exists
         if version.id in self._version_cache:
@@ -173,6 +372,8 @@ class SKOSManagerImpl(SKOSManager):
         # Add to model and cache
         self._version_model.versions.append(version)
         self._version_cache[version.id] = version
+        self._version_index[version.id] = len(self._version_model.versions) - 1
+        self._invalidate_version_results(version.id)
         
         # Persist to repository
         await self.repository.save_version(version)
@@ -181,19 +382,18 @@ class SKOSManagerImpl(SKOSManager):
         """Update an existing version in the model"""
         print(f"🔄 [SKOS Manager] Updating version: {version.id}")
         
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         # Update cache
         self._version_cache[version.id] = version
+        self._invalidate_version_results(version.id)
         print(f"✅ [SKOS Manager] Updated cache for {version.id}")
         
         # Update in model list
-        for i, v in enumerate(self._version_model.versions):
-            if v.id == version.id:
-                self._version_model.versions[i] = version
-                print(f"✅ [SKOS Manager] Updated version in model list at index {i}")
-                break
+        i = self._version_index.get(version.id)
+        if i is not None:
+            self._version_model.versions[i] = version
+            print(f"✅ [SKOS Manager] Updated version in model list at index {i}")
         
         # Persist to repository
         print(f"💾 [SKOS Manager] Saving to repository...")
@@ -203,45 +403,53 @@ class SKOSManagerImpl(SKOSManager):
         # CRITICAL: Invalidate cache to force reload from disk on next request
         # This ensures all workers (in multi-worker setup) get fresh data
         print(f"🔄 [SKOS Manager] Invalidating cache to force reload from disk...")
-        self._version_model = None
-        self._version_cache.clear()
+        self._invalidate_version_model()
         print(f"✅ [SKOS Manager] Cache invalidated! Next request will reload from disk.")
     
     async def reload_version_model(self) -> None:
         """Force reload the version model from storage"""
+        self._invalidate_version_model()
+        await self.load_version_model()
+    
+    def _invalidate_version_model(self) -> None:
+        """Drop the loaded model so the next call reads it from storage again"""
+        self._loaded = False
         self._version_model = None
         self._version_cache.clear()
-        await self.load_version_model()
+        self._version_index.clear()
+    
+    async def _ensure_loaded(self) -> None:
+        """Load the version model on first use"""
+        if not self._loaded:
+            await self.load_version_model()
     
     async def get_all_versions(self) -> List[EuringVersion]:
         """Get all available EURING versions"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         return self._version_model.versions
     
     async def get_version_by_id(self, version_id: str) -> Optional[EuringVersion]:
         """Get a specific version by ID"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         return self._version_cache.get(version_id)
     
     async def add_relationship(self, relationship: VersionRelationship) -> None:
         """Add a new version relationship"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         self._version_model.relationships.append(relationship)
-        await self.repository.save_relationships(self._version_model.relationships)
+        await self.repository.append_relationship(relationship)
     
     async def add_conversion_mapping(self, mapping: ConversionMapping) -> None:
         """Add a new conversion mapping"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         self._version_model.conversion_mappings.append(mapping)
-        await self.repository.save_conversion_mappings(self._version_model.conversion_mappings)
+        self._index_conversion_mapping(mapping)
+        self._conversion_rules_cache.pop((mapping.from_version, mapping.to_version), None)
+        await self.repository.append_conversion_mapping(mapping)
     
     async def create_domain_conversion_mapping(
         self,
@@ -262,8 +470,7 @@ class SKOSManagerImpl(SKOSManager):
             
         Validates: Requirements 5.4, 8.5
         """
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         # Create domain conversion mapping using the domain conversion service
         domain_mapping = await self._domain_conversion_service.create_domain_conversion_mapping(
@@ -276,16 +483,7 @@ class SKOSManagerImpl(SKOSManager):
             'to_version': to_version,
             'compatibility': domain_mapping.compatibility.value,
             'lossy_conversion': domain_mapping.lossy_conversion,
-            'field_mappings': [
-                {
-                    'source_field': fm.source_field,
-                    'target_field': fm.target_field,
-                    'transformation_type': fm.transformation_type.value,
-                    'transformation_function': fm.transformation_function,
-                    'conversion_accuracy': fm.conversion_accuracy
-                }
-                for fm in domain_mapping.field_mappings
-            ],
+            'field_mappings': list(map(_field_mapping_dict, domain_mapping.field_mappings)),
             'transformation_rules': [
                 {
                     'rule_id': tr.rule_id,
@@ -316,15 +514,10 @@ class SKOSManagerImpl(SKOSManager):
             
         Validates: Requirements 5.4, 8.5
         """
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         # Find existing conversion mapping
-        conversion_mapping = None
-        for mapping in self._version_model.conversion_mappings:
-            if mapping.from_version == from_version and mapping.to_version == to_version:
-                conversion_mapping = mapping
-                break
+        conversion_mapping = self._find_conversion_mapping(from_version, to_version)
         
         if not conversion_mapping:
             raise ValueError(f"No conversion mapping found from {from_version} to {to_version}")
@@ -358,8 +551,7 @@ class SKOSManagerImpl(SKOSManager):
             
         Validates: Requirements 5.4, 8.5
         """
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         # Get domain conversion mapping
         domain_mapping = await self._domain_conversion_service.get_domain_conversion_mapping(
@@ -375,10 +567,9 @@ class SKOSManagerImpl(SKOSManager):
                 'message': 'Domain conversion mapping not available'
             }
         
-        # Get transformation rules for this domain
-        transformation_rules = await self._domain_conversion_service.get_domain_transformation_rules(
-            domain, from_version, to_version
-        )
+        # Get transformation rules for this domain (get_domain_transformation_rules
+        # would only look the same mapping up again)
+        transformation_rules = domain_mapping.transformation_rules
         
         # Get compatibility assessment (handle case where evolution data is not available)
         try:
@@ -404,14 +595,9 @@ class SKOSManagerImpl(SKOSManager):
             'compatibility_level': domain_mapping.compatibility.value,
             'lossy_conversion': domain_mapping.lossy_conversion,
             'field_mappings': [
-                {
-                    'source_field': fm.source_field,
-                    'target_field': fm.target_field,
-                    'transformation_type': fm.transformation_type.value,
-                    'transformation_function': fm.transformation_function,
-                    'conversion_accuracy': fm.conversion_accuracy,
-                    'semantic_domain': fm.semantic_domain.value if fm.semantic_domain else None
-                }
+                _field_mapping_dict(
+                    fm, {'semantic_domain': fm.semantic_domain.value if fm.semantic_domain else None}
+                )
                 for fm in domain_mapping.field_mappings
             ],
             'transformation_rules': [
@@ -446,12 +632,9 @@ class SKOSManagerImpl(SKOSManager):
             
         Validates: Requirements 8.5
         """
-        if not self._version_model:
-            await self.load_version_model()
-        
-        domain_assessments = {}
+        await self._ensure_loaded()
         
-        for domain in SemanticDomain:
+        async def assess_one(domain: SemanticDomain) -> Dict[str, Any]:
             try:
                 compatibility_level = await self._domain_conversion_service.assess_domain_compatibility_level(
                     domain, from_version, to_version
@@ -461,30 +644,32 @@ class SKOSManagerImpl(SKOSManager):
                     domain, from_version, to_version
                 )
                 
-                domain_assessments[domain.value] = {
+                return {
                     'compatibility_level': compatibility_level.value,
                     'detailed_assessment': domain_assessment
                 }
                 
             except Exception as e:
-                domain_assessments[domain.value] = {
+                return {
                     'compatibility_level': 'error',
                     'error': str(e),
                     'detailed_assessment': None
                 }
         
-        return domain_assessments
+        # Domains are assessed independently, so their assessments run together
+        domains = list(SemanticDomain)
+        assessments = await asyncio.gather(*(assess_one(domain) for domain in domains))
+        
+        return {domain.value: assessment for domain, assessment in zip(domains, assessments)}
     
     async def get_domain_evolution(self, domain: SemanticDomain) -> DomainEvolution:
         """Get evolution data for a specific domain"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         # Try to get from loaded model first
-        if self._version_model.domain_evolutions:
-            for evolution in self._version_model.domain_evolutions:
-                if evolution.domain == domain:
-                    return evolution
+        evolution = self._find_domain_evolution(domain)
+        if evolution is not None:
+            return evolution
         
         # If not found, try to load from repository
         domain_evolution = await self.repository.load_domain_evolution(domain)
@@ -500,8 +685,7 @@ class SKOSManagerImpl(SKOSManager):
         to_version: str
     ) -> Dict[str, Any]:
         """Analyze compatibility between versions for a specific domain"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         # Use the domain compatibility assessor
         result = await self._domain_compatibility_assessor.assess_domain_compatibility(
@@ -515,7 +699,7 @@ class SKOSManagerImpl(SKOSManager):
     
     async def get_semantic_domains(self) -> List[SemanticDomain]:
         """Get list of available semantic domains"""
-        return list(SemanticDomain)
+        return list(_SEMANTIC_DOMAINS)
     
     async def get_domain_specific_version_characteristics(
         self, 
@@ -523,8 +707,7 @@ class SKOSManagerImpl(SKOSManager):
         domain: SemanticDomain
     ) -> Dict[str, Any]:
         """Get version characteristics specific to a semantic domain"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
         if version not in self._version_cache:
             raise ValueError(f"Version {version} not found")
@@ -538,24 +721,25 @@ class SKOSManagerImpl(SKOSManager):
         ]
         
         # Extract domain-specific patterns
-        domain_patterns = []
-        for field in domain_fields:
-            if field.valid_values:
-                domain_patterns.extend(field.valid_values[:3])  # Take first 3 as examples
-        
-        # Extract domain-specific validation rules
-        domain_validation_rules = [
-            rule.rule_expression for rule in euring_version.validation_rules
-            if any(field.name in rule.rule_expression for field in domain_fields)
-        ]
+        domain_patterns = list(chain.from_iterable(
+            field.valid_values[:3]  # Take first 3 as examples
+            for field in domain_fields if field.valid_values
+        ))
+        
+        # Extract domain-specific validation rules: those mentioning any domain
+        # field name, found with one alternation scan per rule
+        domain_validation_rules = []
+        if domain_fields:
+            field_name_pattern = re.compile(
+                "|".join(re.escape(name) for name in {field.name for field in domain_fields})
+            )
+            domain_validation_rules = [
+                rule.rule_expression for rule in euring_version.validation_rules
+                if field_name_pattern.search(rule.rule_expression)
+            ]
         
         # Get semantic domain mapping if available
-        domain_mapping = None
-        if euring_version.semantic_domains:
-            for mapping in euring_version.semantic_domains:
-                if mapping.domain == domain:
-                    domain_mapping = mapping
-                    break
+        domain_mapping = self._find_semantic_domain_mapping(euring_version, domain)
         
         return {
             "version_id": version,
@@ -578,27 +762,29 @@ class SKOSManagerImpl(SKOSManager):
             "domain_specific_rules": [
                 rule.rule_expression for rule in domain_mapping.domain_specific_rules
             ] if domain_mapping else [],
-            "evolution_notes": [
-                note for field in domain_fields 
-                for note in (field.evolution_notes or [])
-            ]
+            "evolution_notes": list(chain.from_iterable(
+                field.evolution_notes for field in domain_fields if field.evolution_notes
+            ))
         }
     
     async def get_all_domain_characteristics(self, version: str) -> Dict[SemanticDomain, Dict[str, Any]]:
         """Get characteristics for all domains in a specific version"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
             
+        domains = list(SemanticDomain)
+        results = await asyncio.gather(
+            *(self.get_domain_specific_version_characteristics(version, domain) for domain in domains),
+            return_exceptions=True
+        )
+        
         domain_characteristics = {}
         
-        for domain in SemanticDomain:
-            try:
-                characteristics = await self.get_domain_specific_version_characteristics(version, domain)
-                if characteristics["field_count"] > 0:  # Only include domains with fields
-                    domain_characteristics[domain] = characteristics
-            except Exception:
+        for domain, characteristics in zip(domains, results):
+            if isinstance(characteristics, BaseException):
                 # Domain not present in this version, skip
                 continue
+            if characteristics["field_count"] > 0:  # Only include domains with fields
+                domain_characteristics[domain] = characteristics
                 
         return domain_characteristics
     
@@ -609,56 +795,42 @@ class SKOSManagerImpl(SKOSManager):
         to_version: str
     ) -> List[Dict[str, Any]]:
         """Get field mappings for a specific domain between two versions"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         # Find conversion mapping
-        conversion_mapping = None
-        for mapping in self._version_model.conversion_mappings:
-            if mapping.from_version == from_version and mapping.to_version == to_version:
-                conversion_mapping = mapping
-                break
-                
+        conversion_mapping = self._find_conversion_mapping(from_version, to_version)
+        
         if not conversion_mapping:
             raise ValueError(f"No conversion mapping found from {from_version} to {to_version}")
         
-        # Filter field mappings by domain
-        domain_field_mappings = []
-        for field_mapping in conversion_mapping.field_mappings:
-            if field_mapping.semantic_domain == domain:
-                domain_field_mappings.append({
-                    "source_field": field_mapping.source_field,
-                    "target_field": field_mapping.target_field,
-                    "transformation_type": field_mapping.transformation_type.value,
-                    "transformation_function": field_mapping.transformation_function,
-                    "conversion_accuracy": field_mapping.conversion_accuracy,
-                    "semantic_domain": domain.value
-                })
+        fields_by_domain, domain_mapping_by_domain = self._conversion_mapping_domains(conversion_mapping)
+        
+        # Field mappings tagged with the domain
+        domain_extra = {"semantic_domain": domain.value}
+        domain_field_mappings = [
+            _field_mapping_dict(field_mapping, domain_extra)
+            for field_mapping in fields_by_domain.get(domain, ())
+        ]
         
-        # Also check domain-specific mappings if available
-        if conversion_mapping.domain_mappings:
-            for domain_mapping in conversion_mapping.domain_mappings:
-                if domain_mapping.domain == domain:
-                    for field_mapping in domain_mapping.field_mappings:
-                        domain_field_mappings.append({
-                            "source_field": field_mapping.source_field,
-                            "target_field": field_mapping.target_field,
-                            "transformation_type": field_mapping.transformation_type.value,
-                            "transformation_function": field_mapping.transformation_function,
-                            "conversion_accuracy": field_mapping.conversion_accuracy,
-                            "semantic_domain": domain.value,
-                            "domain_specific": True,
-                            "lossy_conversion": domain_mapping.lossy_conversion,
-                            "conversion_notes": domain_mapping.conversion_notes
-                        })
-                    break
+        # Also include domain-specific mappings if available
+        domain_mapping = domain_mapping_by_domain.get(domain)
+        if domain_mapping is not None:
+            domain_specific_extra = {
+                **domain_extra,
+                "domain_specific": True,
+                "lossy_conversion": domain_mapping.lossy_conversion,
+                "conversion_notes": domain_mapping.conversion_notes
+            }
+            domain_field_mappings.extend(
+                _field_mapping_dict(field_mapping, domain_specific_extra)
+                for field_mapping in domain_mapping.field_mappings
+            )
         
         return domain_field_mappings
     
     async def get_domain_evolution_summary(self, domain: SemanticDomain) -> Dict[str, Any]:
         """Get a summary of domain evolution across all versions"""
-        if not self._version_model:
-            await self.load_version_model()
+        await self._ensure_loaded()
         
         try:
             domain_evolution = await self.get_domain_evolution(domain)
@@ -670,34 +842,34 @@ class SKOSManagerImpl(SKOSManager):
                 "message": "Domain evolution data not available"
             }
         
+        evolution_entries = domain_evolution.evolution_entries
+        
         # Calculate summary statistics
-        total_changes = sum(len(entry.changes) for entry in domain_evolution.evolution_entries)
-        versions_with_changes = len(domain_evolution.evolution_entries)
+        total_changes = sum(len(entry.changes) for entry in evolution_entries)
+        versions_with_changes = len(evolution_entries)
         
         # Categorize changes by type
-        change_types = {}
-        for entry in domain_evolution.evolution_entries:
-            for change in entry.changes:
-                change_type = change.change_type.value
-                if change_type not in change_types:
-                    change_types[change_type] = 0
-                change_types[change_type] += 1
+        change_types = Counter(
+            change.change_type.value for entry in evolution_entries for change in entry.changes
+        )
         
         # Get compatibility overview
+        # Count the raw levels first so the enum-or-string check runs once per
+        # distinct level rather than once per matrix entry
         compatibility_overview = {}
         if domain_evolution.compatibility_matrix:
-            for (from_ver, to_ver), level in domain_evolution.compatibility_matrix.compatibility_map.items():
-                level_str = level.value if hasattr(level, 'value') else str(level)
-                if level_str not in compatibility_overview:
-                    compatibility_overview[level_str] = 0
-                compatibility_overview[level_str] += 1
+            for level, count in Counter(
+                domain_evolution.compatibility_matrix.compatibility_map.values()
+            ).items():
+                level_str = level.value if isinstance(level, Enum) else str(level)
+                compatibility_overview[level_str] = compatibility_overview.get(level_str, 0) + count
         
         return {
             "domain": domain.value,
             "evolution_available": True,
             "total_changes": total_changes,
             "versions_with_changes": versions_with_changes,
-            "change_types": change_types,
+            "change_types": dict(change_types),
             "compatibility_overview": compatibility_overview,
             "evolution_entries": [
                 {
@@ -709,7 +881,7 @@ class SKOSManagerImpl(SKOSManager):
                     "fields_modified": entry.fields_modified or [],
                     "semantic_notes": entry.semantic_notes[:3] if entry.semantic_notes else []  # First 3 notes
                 }
-                for entry in sorted(domain_evolution.evolution_entries, key=lambda e: e.year)
+                for entry in self._sorted_evolution_entries_for(domain_evolution)
             ]
         }
     
@@ -720,36 +892,47 @@ class SKOSManagerImpl(SKOSManager):
         version2: str
     ) -> Dict[str, Any]:
         """Compare a specific domain between two versions"""
-        if not self._version_model:
-            await self.load_version_model()
-        
-        # Get domain characteristics for both versions
-        try:
-            v1_characteristics = await self.get_domain_specific_version_characteristics(version1, domain)
-        except ValueError:
+        await self._ensure_loaded()
+        
+        # Get domain characteristics for both versions; a missing version
+        # (ValueError) compares as an empty domain
+        v1_characteristics, v2_characteristics = await asyncio.gather(
+            self.get_domain_specific_version_characteristics(version1, domain),
+            self.get_domain_specific_version_characteristics(version2, domain),
+            return_exceptions=True
+        )
+        if isinstance(v1_characteristics, ValueError):
             v1_characteristics = {"field_count": 0, "fields": []}
-        
-        try:
-            v2_characteristics = await self.get_domain_specific_version_characteristics(version2, domain)
-        except ValueError:
+        elif isinstance(v1_characteristics, BaseException):
+            raise v1_characteristics
+        if isinstance(v2_characteristics, ValueError):
             v2_characteristics = {"field_count": 0, "fields": []}
+        elif isinstance(v2_characteristics, BaseException):
+            raise v2_characteristics
         
         # Compare field counts
         field_count_diff = v2_characteristics["field_count"] - v1_characteristics["field_count"]
         
-        # Compare fields
-        v1_field_names = {field["name"] for field in v1_characteristics["fields"]}
-        v2_field_names = {field["name"] for field in v2_characteristics["fields"]}
+        # Compare fields by name, keeping the first field of each name in field order
+        v1_fields_by_name = {}
+        for field in v1_characteristics["fields"]:
+            v1_fields_by_name.setdefault(field["name"], field)
+        v2_fields_by_name = {}
+        for field in v2_characteristics["fields"]:
+            v2_fields_by_name.setdefault(field["name"], field)
         
-        added_fields = v2_field_names - v1_field_names
-        removed_fields = v1_field_names - v2_field_names
-        common_fields = v1_field_names & v2_field_names
+        added_fields = [name for name in v2_fields_by_name if name not in v1_fields_by_name]
+        removed_fields = []
+        common_fields_count = 0
         
-        # Check for field modifications in common fields
+        # Check for field modifications in common fields in the same pass
         modified_fields = []
-        for field_name in common_fields:
-            v1_field = next(f for f in v1_characteristics["fields"] if f["name"] == field_name)
-            v2_field = next(f for f in v2_characteristics["fields"] if f["name"] == field_name)
+        for field_name, v1_field in v1_fields_by_name.items():
+            v2_field = v2_fields_by_name.get(field_name)
+            if v2_field is None:
+                removed_fields.append(field_name)
+                continue
+            common_fields_count += 1
             
             modifications = []
             if v1_field["data_type"] != v2_field["data_type"]:
@@ -778,10 +961,10 @@ class SKOSManagerImpl(SKOSManager):
             "version1": version1,
             "version2": version2,
             "field_count_difference": field_count_diff,
-            "added_fields": list(added_fields),
-            "removed_fields": list(removed_fields),
+            "added_fields": added_fields,
+            "removed_fields": removed_fields,
             "modified_fields": modified_fields,
-            "common_fields_count": len(common_fields),
+            "common_fields_count": common_fields_count,
             "compatibility_info": compatibility_info,
             "summary": {
                 "has_changes": field_count_diff != 0 or len(added_fields) > 0 or len(removed_fields) > 0 or len(modified_fields) > 0,
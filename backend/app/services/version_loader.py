@@ -3,7 +3,11 @@ Version Loader Service for EURING Code Recognition System
 Handles loading and validation of historical EURING versions with domain organization
 """
 import asyncio
-from typing import List, Dict, Optional, Set, Tuple
+import re
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import List, Dict, FrozenSet, Optional, Set, Tuple
 from pathlib import Path
 from ..models.euring_models import (
     EuringVersion, EuringVersionModel, SemanticDomain, FieldDefinition,
@@ -14,6 +18,10 @@ from .skos_manager import SKOSManagerImpl
 from ..repositories.skos_repository import SKOSRepository
 
 
+# Characters that make a domain field pattern more than a plain word
+_REGEX_METACHARACTERS = re.compile(r"[\\^$.|?*+()\[\]{}]")
+
+
 class VersionLoaderService:
     """Service for loading and validating historical EURING versions with domain organization"""
     
@@ -21,7 +29,21 @@ class VersionLoaderService:
         self.skos_manager = SKOSManagerImpl(data_directory)
         self.repository = SKOSRepository(data_directory)
         self._domain_field_patterns = self._initialize_domain_field_patterns()
+        # Plain-word patterns are matched with substring tests, which give the same
+        # answer as re.search without the regex engine; the rest stay regexes
+        self._domain_field_words, self._domain_field_regexes = self._split_domain_field_patterns(
+            self._domain_field_patterns
+        )
+        # Classification depends only on a field's name and description, which
+        # repeat across versions and are re-checked by the assignment validation
+        self._classify_field_text = lru_cache(maxsize=4096)(self._classify_field_text_uncached)
         self._loaded_versions: Dict[str, EuringVersion] = {}
+        # Version id -> (field list, its field names); reused while the version
+        # keeps the same field list
+        self._field_names_cache: Dict[str, Tuple[list, int, FrozenSet[str]]] = {}
+        # (version list, its length, versions sorted by year, their years) for
+        # the last version list sorted
+        self._versions_by_year: Tuple[Optional[list], int, List[EuringVersion], List[int]] = (None, 0, [], [])
         
     def _initialize_domain_field_patterns(self) -> Dict[SemanticDomain, List[str]]:
         """Initialize patterns for automatic domain assignment"""
@@ -49,16 +71,35 @@ class VersionLoaderService:
             ]
         }
         
+    @staticmethod
+    def _split_domain_field_patterns(
+        domain_field_patterns: Dict[SemanticDomain, List[str]]
+    ) -> Tuple[Tuple[Tuple[str, SemanticDomain], ...], Tuple[Tuple["re.Pattern[str]", SemanticDomain], ...]]:
+        """(pattern, domain) pairs in declaration order: plain words, then compiled regexes"""
+        words = []
+        regexes = []
+        for domain, patterns in domain_field_patterns.items():
+            for pattern in patterns:
+                if _REGEX_METACHARACTERS.search(pattern):
+                    regexes.append((re.compile(pattern), domain))
+                else:
+                    words.append((pattern, domain))
+        return tuple(words), tuple(regexes)
+        
     async def load_all_historical_versions(self) -> EuringVersionModel:
         """Load all historical EURING versions from 1963 to present with domain organization"""
         try:
             # Load the complete version model
             version_model = await self.skos_manager.load_version_model()
             
-            # Assign fields to semantic domains for each version
-            for version in version_model.versions:
+            # Assign fields to semantic domains for each version; versions are
+            # independent, so they are prepared concurrently
+            async def prepare(version: EuringVersion) -> None:
                 await self._assign_fields_to_domains(version)
                 await self._create_domain_mappings(version)
+            
+            await asyncio.gather(*(prepare(version) for version in version_model.versions))
+            for version in version_model.versions:
                 self._loaded_versions[version.id] = version
             
             # Validate domain mappings
@@ -82,11 +123,9 @@ class VersionLoaderService:
     async def get_versions_by_year_range(self, start_year: int, end_year: int) -> List[EuringVersion]:
         """Get EURING versions within a specific year range"""
         version_model = await self.skos_manager.load_version_model()
+        sorted_versions, years = self._sorted_by_year(version_model.versions)
         
-        return [
-            version for version in version_model.versions
-            if start_year <= version.year <= end_year
-        ]
+        return sorted_versions[bisect_left(years, start_year):bisect_right(years, end_year)]
     
     async def get_version_by_year(self, year: int) -> Optional[EuringVersion]:
         """Get the EURING version that was active in a specific year"""
@@ -94,14 +133,18 @@ class VersionLoaderService:
         
         # Find the version that was active in the given year
         # This assumes versions are active from their year until the next version
-        active_version = None
-        for version in sorted(version_model.versions, key=lambda v: v.year):
-            if version.year <= year:
-                active_version = version
-            else:
-                break
-                
-        return active_version
+        sorted_versions, years = self._sorted_by_year(version_model.versions)
+        index = bisect_right(years, year) - 1
+        return sorted_versions[index] if index >= 0 else None
+    
+    def _sorted_by_year(self, versions: List[EuringVersion]) -> Tuple[List[EuringVersion], List[int]]:
+        """Versions in stable year order with their years, sorted once per version list"""
+        source, size, sorted_versions, years = self._versions_by_year
+        if source is not versions or size != len(versions):
+            sorted_versions = sorted(versions, key=lambda v: v.year)
+            years = [version.year for version in sorted_versions]
+            self._versions_by_year = (versions, len(versions), sorted_versions, years)
+        return sorted_versions, years
     
     async def validate_version_data(self, version: EuringVersion) -> Dict[str, List[str]]:
         """Validate a single version's data integrity"""
@@ -132,7 +175,7 @@ class VersionLoaderService:
                 )
         
         # Validate validation rules
-        field_names = {field.name for field in version.field_definitions}
+        field_names = self._field_names(version)
         for rule in version.validation_rules:
             if rule.field_name not in field_names:
                 errors.append(f"Validation rule references unknown field: {rule.field_name}")
@@ -142,6 +185,15 @@ class VersionLoaderService:
             "warnings": warnings
         }
     
+    def _field_names(self, version: EuringVersion) -> FrozenSet[str]:
+        """Names of a version's fields, rebuilt only when its field list changes"""
+        fields = version.field_definitions
+        source, size, names = self._field_names_cache.get(version.id, (None, 0, frozenset()))
+        if source is not fields or size != len(fields):
+            names = frozenset(field.name for field in fields)
+            self._field_names_cache[version.id] = (fields, len(fields), names)
+        return names
+    
     async def get_version_statistics(self) -> Dict[str, any]:
         """Get statistics about loaded versions"""
         version_model = await self.skos_manager.load_version_model()
@@ -173,8 +225,7 @@ class VersionLoaderService:
     async def reload_versions(self) -> EuringVersionModel:
         """Force reload of all version data from storage"""
         # Clear the cached model
-        self.skos_manager._version_model = None
-        self.skos_manager._version_cache = {}
+        self.skos_manager._invalidate_version_model()
         
         # Reload from storage
         return await self.load_all_historical_versions()
@@ -194,7 +245,7 @@ class VersionLoaderService:
             raise ValueError(f"Missing early versions: earliest version is from {earliest_year}, expected 1966")
         
         # Check for reasonable coverage (at least one version per decade)
-        decades_covered = set((year // 10) * 10 for year in years)
+        decades_covered = {(year // 10) * 10 for year in years}
         expected_decades = set(range(1960, 2030, 10))
         
         missing_decades = expected_decades - decades_covered
@@ -203,25 +254,19 @@ class VersionLoaderService:
     
     async def _validate_version_integrity(self, versions: List[EuringVersion]) -> None:
         """Validate integrity of all versions"""
-        validation_results = []
-        
-        for version in versions:
-            result = await self.validate_version_data(version)
-            if result["errors"]:
-                validation_results.append(f"Version {version.id}: {', '.join(result['errors'])}")
+        results = await asyncio.gather(*(self.validate_version_data(version) for version in versions))
+        validation_results = [
+            f"Version {version.id}: {', '.join(result['errors'])}"
+            for version, result in zip(versions, results)
+            if result["errors"]
+        ]
         
         if validation_results:
             raise ValueError(f"Version validation failed: {'; '.join(validation_results)}")
     
     def _group_versions_by_decade(self, versions: List[EuringVersion]) -> Dict[str, int]:
         """Group versions by decade for statistics"""
-        decades = {}
-        for version in versions:
-            decade = (version.year // 10) * 10
-            decade_key = f"{decade}s"
-            decades[decade_key] = decades.get(decade_key, 0) + 1
-        
-        return decades
+        return dict(Counter(f"{(version.year // 10) * 10}s" for version in versions))
     
     # ========================================
     # DOMAIN ORGANIZATION METHODS
@@ -229,15 +274,9 @@ class VersionLoaderService:
     
     async def _assign_fields_to_domains(self, version: EuringVersion) -> None:
         """Assign fields to semantic domains based on patterns and existing assignments"""
-        import re
-        
-        for field in version.field_definitions:
-            # Skip if already assigned
-            if field.semantic_domain:
-                continue
-                
-            # Try to assign based on field name and description patterns
-            assigned_domain = self._determine_field_domain(field)
+        # Only fields without an assignment are classified, in one batch
+        unassigned = [field for field in version.field_definitions if not field.semantic_domain]
+        for field, assigned_domain in zip(unassigned, self._classify_batch(unassigned)):
             if assigned_domain:
                 field.semantic_domain = assigned_domain
                 
@@ -246,23 +285,36 @@ class VersionLoaderService:
     
     def _determine_field_domain(self, field: FieldDefinition) -> Optional[SemanticDomain]:
         """Determine semantic domain for a field based on patterns"""
-        import re
-        
-        field_text = f"{field.name} {field.description}".lower()
+        return self._classify_field_text(field.name, field.description)
+    
+    def _classify_batch(self, fields: List[FieldDefinition]) -> List[SemanticDomain]:
+        """Semantic domain for each of a list of fields, in order"""
+        return list(map(
+            self._classify_field_text,
+            [field.name for field in fields],
+            [field.description for field in fields]
+        ))
+    
+    def _classify_field_text_uncached(self, name: str, description: str) -> SemanticDomain:
+        """Semantic domain whose patterns best match a field name and description"""
+        field_text = f"{name} {description}".lower()
         
-        # Score each domain based on pattern matches
+        # Score each domain by how many of its patterns match
         domain_scores = {}
-        for domain, patterns in self._domain_field_patterns.items():
-            score = 0
-            for pattern in patterns:
-                if re.search(pattern, field_text):
-                    score += 1
-            if score > 0:
-                domain_scores[domain] = score
-        
-        # Return domain with highest score, if any
+        for pattern, domain in self._domain_field_words:
+            if pattern in field_text:
+                domain_scores[domain] = domain_scores.get(domain, 0) + 1
+        for regex, domain in self._domain_field_regexes:
+            if regex.search(field_text):
+                domain_scores[domain] = domain_scores.get(domain, 0) + 1
+        
+        # Return domain with highest score, if any; ties go to the domain
+        # declared first
         if domain_scores:
-            return max(domain_scores.keys(), key=lambda d: domain_scores[d])
+            return max(
+                (domain for domain in self._domain_field_patterns if domain in domain_scores),
+                key=domain_scores.__getitem__
+            )
         
         # Fallback to methodology for unclassified fields
         return SemanticDomain.METHODOLOGY
@@ -373,10 +425,11 @@ class VersionLoaderService:
             
             # Validate domain mappings consistency
             if version.semantic_domains:
+                # Fields by name, reversed so the first field of each name wins
+                fields_by_name = {f.name: f for f in reversed(version.field_definitions)}
                 for domain_mapping in version.semantic_domains:
                     # Check that all mapped fields exist in version
-                    version_field_names = {f.name for f in version.field_definitions}
-                    missing_fields = set(domain_mapping.fields) - version_field_names
+                    missing_fields = set(domain_mapping.fields).difference(self._field_names(version))
                     if missing_fields:
                         validation_errors.append(
                             f"Version {version.id}, Domain {domain_mapping.domain.value}: "
@@ -385,7 +438,7 @@ class VersionLoaderService:
                     
                     # Check that mapped fields have correct domain assignment
                     for field_name in domain_mapping.fields:
-                        field = next((f for f in version.field_definitions if f.name == field_name), None)
+                        field = fields_by_name.get(field_name)
                         if field and field.semantic_domain != domain_mapping.domain:
                             validation_errors.append(
                                 f"Version {version.id}: Field {field_name} domain mismatch - "
@@ -398,35 +451,55 @@ class VersionLoaderService:
     async def _track_domain_evolution(self, versions: List[EuringVersion]) -> List[DomainEvolution]:
         """Track domain evolution across versions"""
         # Sort versions by year
-        sorted_versions = sorted(versions, key=lambda v: v.year)
+        sorted_versions, _ = self._sorted_by_year(versions)
+        
+        # Bucket each version's fields once, shared by every domain's analysis
+        version_field_indexes = [self._index_version_fields(version) for version in sorted_versions]
         
         # Track evolution for each domain
         domain_evolutions = []
         for domain in SemanticDomain:
-            evolution = await self._analyze_domain_evolution_across_versions(domain, sorted_versions)
+            evolution = await self._analyze_domain_evolution_across_versions(
+                domain, sorted_versions, version_field_indexes
+            )
             if evolution.evolution_entries:  # Only include domains with evolution data
                 domain_evolutions.append(evolution)
         
         return domain_evolutions
     
+    @staticmethod
+    def _index_version_fields(
+        version: EuringVersion
+    ) -> Tuple[Dict[Optional[SemanticDomain], Set[str]], Dict[str, FieldDefinition]]:
+        """A version's field names grouped by domain, and its fields by name (first wins)"""
+        names_by_domain: Dict[Optional[SemanticDomain], Set[str]] = {}
+        for field in version.field_definitions:
+            names_by_domain.setdefault(field.semantic_domain, set()).add(field.name)
+        fields_by_name = {f.name: f for f in reversed(version.field_definitions)}
+        return names_by_domain, fields_by_name
+    
     async def _analyze_domain_evolution_across_versions(
         self, 
         domain: SemanticDomain, 
-        sorted_versions: List[EuringVersion]
+        sorted_versions: List[EuringVersion],
+        version_field_indexes: Optional[
+            List[Tuple[Dict[Optional[SemanticDomain], Set[str]], Dict[str, FieldDefinition]]]
+        ] = None
     ) -> DomainEvolution:
         """Analyze evolution of a specific domain across versions"""
+        if version_field_indexes is None:
+            version_field_indexes = [self._index_version_fields(version) for version in sorted_versions]
+        
         evolution_entries = []
         compatibility_matrix = DomainCompatibilityMatrix(domain=domain)
+        domain_value = domain.value
         
         # Track fields for this domain across versions
         previous_fields = set()
         
         for i, version in enumerate(sorted_versions):
             # Get fields for this domain in current version
-            current_fields = {
-                field.name for field in version.field_definitions 
-                if field.semantic_domain == domain
-            }
+            current_fields = version_field_indexes[i][0].get(domain, set())
             
             if not current_fields:
                 continue  # Skip versions without fields for this domain
@@ -446,29 +519,33 @@ class VersionLoaderService:
                 fields_removed = list(removed)
                 
                 # Create change objects
-                for field_name in added:
-                    changes.append(DomainChange(
+                changes.extend(
+                    DomainChange(
                         change_type=DomainChangeType.ADDED,
                         field_name=field_name,
                         new_value=field_name,
-                        semantic_impact=f"Added {field_name} to {domain.value}",
+                        semantic_impact=f"Added {field_name} to {domain_value}",
                         compatibility_impact=DomainCompatibilityLevel.PARTIAL
-                    ))
-                
-                for field_name in removed:
-                    changes.append(DomainChange(
+                    )
+                    for field_name in fields_added
+                )
+                changes.extend(
+                    DomainChange(
                         change_type=DomainChangeType.REMOVED,
                         field_name=field_name,
                         previous_value=field_name,
-                        semantic_impact=f"Removed {field_name} from {domain.value}",
+                        semantic_impact=f"Removed {field_name} from {domain_value}",
                         compatibility_impact=DomainCompatibilityLevel.LOSSY
-                    ))
+                    )
+                    for field_name in fields_removed
+                )
                 
                 # Check for modifications in common fields
+                current_by_name = version_field_indexes[i][1]
+                prev_by_name = version_field_indexes[i - 1][1]
                 for field_name in common:
-                    current_field = next(f for f in version.field_definitions if f.name == field_name)
-                    prev_version = sorted_versions[i-1]
-                    prev_field = next((f for f in prev_version.field_definitions if f.name == field_name), None)
+                    current_field = current_by_name[field_name]
+                    prev_field = prev_by_name.get(field_name)
                     
                     if prev_field and self._field_has_changed(prev_field, current_field):
                         fields_modified.append(field_name)
@@ -477,7 +554,7 @@ class VersionLoaderService:
                             field_name=field_name,
                             previous_value=f"{prev_field.data_type}({prev_field.length})",
                             new_value=f"{current_field.data_type}({current_field.length})",
-                            semantic_impact=f"Modified {field_name} in {domain.value}",
+                            semantic_impact=f"Modified {field_name} in {domain_value}",
                             compatibility_impact=DomainCompatibilityLevel.PARTIAL
                         ))
             
@@ -488,7 +565,7 @@ class VersionLoaderService:
                 changes=changes,
                 field_mappings=[],  # Will be populated later if needed
                 semantic_notes=[
-                    f"Domain {domain.value} has {len(current_fields)} fields in {version.id}",
+                    f"Domain {domain_value} has {len(current_fields)} fields in {version.id}",
                     f"Changes: +{len(fields_added)} -{len(fields_removed)} ~{len(fields_modified)}"
                 ],
                 fields_added=fields_added,
@@ -517,11 +594,13 @@ class VersionLoaderService:
     
     def _field_has_changed(self, field1: FieldDefinition, field2: FieldDefinition) -> bool:
         """Check if a field has changed between versions"""
+        # Scalar attributes first; the valid value lists are only compared
+        # element by element when everything else matches
         return (
             field1.data_type != field2.data_type or
             field1.length != field2.length or
-            field1.valid_values != field2.valid_values or
-            field1.description != field2.description
+            field1.description != field2.description or
+            field1.valid_values != field2.valid_values
         )
     
     def _calculate_domain_compatibility_level(
@@ -563,8 +642,7 @@ class VersionLoaderService:
     async def reload_versions_with_domain_organization(self) -> EuringVersionModel:
         """Force reload of all version data with domain organization"""
         # Clear caches
-        self.skos_manager._version_model = None
-        self.skos_manager._version_cache = {}
+        self.skos_manager._invalidate_version_model()
         self._loaded_versions = {}
         
         # Reload with domain organization
@@ -572,21 +650,32 @@ class VersionLoaderService:
     
     async def update_version_domain_mappings(self, version_id: str) -> None:
         """Update domain mappings for a specific version"""
-        if version_id not in self._loaded_versions:
-            raise ValueError(f"Version {version_id} not loaded")
-        
-        version = self._loaded_versions[version_id]
-        
-        # Re-assign fields to domains
-        await self._assign_fields_to_domains(version)
-        
-        # Re-create domain mappings
-        await self._create_domain_mappings(version)
-        
-        # Save updated version
-        await self.repository.save_version(version)
+        await self.update_versions_domain_mappings([version_id])
+    
+    async def update_versions_domain_mappings(self, version_ids: List[str]) -> None:
+        """Update domain mappings for several versions, saving them concurrently"""
+        for version_id in version_ids:
+            if version_id not in self._loaded_versions:
+                raise ValueError(f"Version {version_id} not loaded")
+        
+        # A repeated id would save the same file from two threads at once
+        version_ids = list(dict.fromkeys(version_ids))
+        versions = [self._loaded_versions[version_id] for version_id in version_ids]
+        
+        # Re-assign fields to domains and re-create domain mappings
+        async def remap(version: EuringVersion) -> None:
+            await self._assign_fields_to_domains(version)
+            await self._create_domain_mappings(version)
+        
+        await asyncio.gather(*(remap(version) for version in versions))
+        
+        # Save updated versions; file writes block, so each runs in a worker thread
+        await asyncio.gather(
+            *(asyncio.to_thread(self.repository.save_version_sync, version) for version in versions)
+        )
         
-        print(f"Updated domain mappings for version {version_id}")
+        for version_id in version_ids:
+            print(f"Updated domain mappings for version {version_id}")
     
     async def get_domain_statistics_for_version(self, version_id: str) -> Dict[str, any]:
         """Get domain statistics for a specific version"""
@@ -596,12 +685,15 @@ class VersionLoaderService:
         version = self._loaded_versions[version_id]
         domain_stats = {}
         
-        # Count fields by domain
+        # Bucket fields by domain in one pass
+        fields_by_domain: Dict[SemanticDomain, List[FieldDefinition]] = defaultdict(list)
+        for field in version.field_definitions:
+            if field.semantic_domain:
+                fields_by_domain[field.semantic_domain].append(field)
+        
+        # Count fields by domain, in domain declaration order
         for domain in SemanticDomain:
-            domain_fields = [
-                field for field in version.field_definitions 
-                if field.semantic_domain == domain
-            ]
+            domain_fields = fields_by_domain.get(domain)
             
             if domain_fields:
                 domain_stats[domain.value] = {
@@ -616,7 +708,5 @@ class VersionLoaderService:
             "total_domains": len(domain_stats),
             "domain_statistics": domain_stats,
             "total_fields": len(version.field_definitions),
-            "fields_with_domains": len([
-                f for f in version.field_definitions if f.semantic_domain
-            ])
+            "fields_with_domains": sum(map(len, fields_by_domain.values()))
         }
\ No newline at end of file
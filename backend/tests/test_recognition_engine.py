@@ -0,0 +1,160 @@
+"""
+Tests for coalesced single-string recognition
+"""
+import pytest
+import asyncio
+from backend.app.services.recognition_engine import RecognitionEngineImpl, PatternMatcher
+from backend.app.services.skos_manager import SKOSManagerImpl
+
+
+SAMPLE_STRINGS = [
+    "05320ISA12345 099200501199505215215N01325E10321--0500115--075010--001090------",
+    "05320|ISA12345|0|09920|3|2|20230521|1430|52.25412|-1.34521|1|10|01|0|0|135.5|19.5|4|2|0|0|2",
+    "IAB01ABC123456701ZZ12345123450010MM11300990150620231120012344512345012345671000010000000000000",
+    "05320 ISA12345 0 99 2 05 01 1995 5215N 01325E 1 0321 0500 115",
+    "garbage string here",
+]
+
+
+class TestRecognitionCoalescing:
+    """Test merging concurrent recognize_version calls into batches"""
+
+    @pytest.fixture
+    def skos_manager(self):
+        """Create a SKOS manager for testing"""
+        return SKOSManagerImpl("data/euring_versions")
+
+    @pytest.mark.asyncio
+    async def test_coalesced_results_follow_submission_order(self, skos_manager):
+        """Concurrent coalesced calls each get the result for their own string"""
+        engine = RecognitionEngineImpl(skos_manager)
+        expected = [
+            (await engine.recognize_version(s)).detected_version.id for s in SAMPLE_STRINGS
+        ]
+
+        engine.enable_coalescing = True
+        strings = SAMPLE_STRINGS * 4
+        results = await asyncio.gather(*(engine.recognize_version(s) for s in strings))
+
+        assert [r.detected_version.id for r in results] == expected * 4
+
+    @pytest.mark.asyncio
+    async def test_coalesced_errors_reach_every_caller(self, skos_manager):
+        """A failing batch raises in every call that was merged into it"""
+        engine = RecognitionEngineImpl(skos_manager)
+        engine.enable_coalescing = True
+
+        async def failing_batch(strings, versions):
+            raise RuntimeError("batch failed")
+        engine.batch_processor.process_mixed_version_batch = failing_batch
+
+        results = await asyncio.gather(
+            *(engine.recognize_version(s) for s in SAMPLE_STRINGS),
+            return_exceptions=True
+        )
+
+        assert len(results) == len(SAMPLE_STRINGS)
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+
+    @pytest.mark.asyncio
+    async def test_short_batch_fails_every_caller(self, skos_manager):
+        """A batch that returns too few results fails every call instead of leaving some waiting"""
+        engine = RecognitionEngineImpl(skos_manager)
+        engine.enable_coalescing = True
+
+        async def short_batch(strings, versions):
+            return []
+        engine.batch_processor.process_mixed_version_batch = short_batch
+
+        results = await asyncio.wait_for(asyncio.gather(
+            *(engine.recognize_version(s) for s in SAMPLE_STRINGS),
+            return_exceptions=True
+        ), timeout=5)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_cancels_every_caller(self, skos_manager):
+        """Cancelling a running batch cancels the calls merged into it"""
+        engine = RecognitionEngineImpl(skos_manager)
+        engine.enable_coalescing = True
+        started = asyncio.Event()
+
+        async def stalled_batch(strings, versions):
+            started.set()
+            await asyncio.Event().wait()
+        engine.batch_processor.process_mixed_version_batch = stalled_batch
+
+        calls = asyncio.gather(
+            *(engine.recognize_version(s) for s in SAMPLE_STRINGS),
+            return_exceptions=True
+        )
+        await started.wait()
+        for task in list(engine._batcher._tasks):
+            task.cancel()
+
+        results = await asyncio.wait_for(calls, timeout=5)
+        assert all(isinstance(r, asyncio.CancelledError) for r in results)
+
+class TestRecognizeVersion:
+    """Test single-string recognition edge cases"""
+
+    @pytest.mark.asyncio
+    async def test_no_versions_reports_missing_candidates(self):
+        """With no versions loaded, recognition fails the same way with or without the fast path"""
+        engine = RecognitionEngineImpl(SKOSManagerImpl("data/euring_versions"))
+        engine._versions_cache = []
+
+        with pytest.raises(ValueError, match="No candidates"):
+            await engine.recognize_version(SAMPLE_STRINGS[0])
+
+
+    @pytest.mark.asyncio
+    async def test_uncertainty_options_are_independent_copies(self):
+        """Changing a returned version does not leak into later results"""
+        engine = RecognitionEngineImpl(SKOSManagerImpl("data/euring_versions"))
+
+        first = await engine.handle_uncertain_recognition(SAMPLE_STRINGS[0])
+        version = first['options'][0]['version']
+        original_name = version['name']
+        version['name'] = "changed"
+        version['field_definitions'].clear()
+
+        second = await engine.handle_uncertain_recognition(SAMPLE_STRINGS[0])
+        assert second['options'][0]['version']['name'] == original_name
+        assert second['options'][0]['version']['field_definitions']
+
+        engine.clear_versions_cache()
+        third = await engine.handle_uncertain_recognition(SAMPLE_STRINGS[0])
+        assert third['options'][0]['version'] == second['options'][0]['version']
+
+class TestPatternMatcher:
+    """Test match scoring options"""
+
+    @pytest.mark.asyncio
+    async def test_timings_can_be_disabled(self):
+        """Without timing, match scoring reports zero processing time"""
+        version_model = await SKOSManagerImpl("data/euring_versions").load_version_model()
+        version = version_model.versions[0]
+
+        _, analysis = PatternMatcher(record_timings=False).calculate_match_score(SAMPLE_STRINGS[0], version)
+        assert analysis['processing_time_ms'] == 0.0
+
+        _, analysis = PatternMatcher().calculate_match_score(SAMPLE_STRINGS[0], version)
+        assert analysis['processing_time_ms'] > 0.0
+
+    @pytest.mark.asyncio
+    async def test_valid_values_follow_reloaded_definitions(self):
+        """A reloaded field definition gets its own valid values instead of a stale set"""
+        manager = SKOSManagerImpl("data/euring_versions")
+        version = (await manager.load_version_model()).versions[0]
+        field_def = version.field_definitions[0]
+        value = "X" * field_def.length
+        matcher = PatternMatcher()
+
+        original = field_def.model_copy(update={"valid_values": ["Y" * field_def.length]})
+        reloaded = field_def.model_copy(update={"valid_values": [value]})
+        assert not matcher._validate_field_value(value, original, version.id)
+        assert matcher._validate_field_value(value, reloaded, version.id)
+        assert len(matcher._valid_values_sets) == 1
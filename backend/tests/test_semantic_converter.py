@@ -0,0 +1,28 @@
+"""
+Tests for semantic conversion between EURING versions
+"""
+import pytest
+from backend.app.services.semantic_converter import SemanticConverter
+
+
+class TestSemanticConversion:
+    """Test conversion from semantic data to version formats"""
+
+    @pytest.fixture
+    def converter(self):
+        """Create a semantic converter for testing"""
+        return SemanticConverter()
+
+    def test_ring_2020_keeps_unicode_letters_and_digits(self, converter):
+        """Ring normalization filters with str.isalpha / str.isdigit, so non-ASCII characters count"""
+        target_field = converter.version_mappings['2020']['ring_identification']
+
+        ascii_ring = converter.convert_semantic_to_version(
+            {'ring_identification': {'value': 'AB-123'}}, '2020'
+        )
+        unicode_ring = converter.convert_semantic_to_version(
+            {'ring_identification': {'value': 'Äé ١٢٣'}}, '2020'
+        )
+
+        assert ascii_ring[target_field] == 'ABA00123'
+        assert unicode_ring[target_field] == 'ÄéA00١٢٣'
@@ -0,0 +1,41 @@
+"""
+Tests for semantic field grouping
+"""
+import pytest
+from backend.app.services.semantic_field_grouper import SemanticFieldGrouper, SemanticMeaning
+from backend.app.models.euring_models import SemanticDomain
+
+
+def make_meaning(field_name: str, concept: str, domain: SemanticDomain) -> SemanticMeaning:
+    return SemanticMeaning(
+        field_name=field_name,
+        primary_concept=concept,
+        secondary_concepts=(),
+        semantic_category="test",
+        domain=domain,
+        confidence=1.0,
+        linguistic_patterns=()
+    )
+
+
+class TestSemanticRelationships:
+    """Test relationship detection between fields"""
+
+    def test_strong_rule_links_cross_domain_fields(self):
+        """A rule strong enough to clear the threshold on its own is not pruned"""
+        class StrongRuleGrouper(SemanticFieldGrouper):
+            def _initialize_relationship_rules(self):
+                return [{
+                    "type": "exact_pair",
+                    "pattern": [r"alpha", r"omega"],
+                    "strength": 1.0,
+                    "description": "Always related"
+                }]
+
+        meanings = [
+            make_meaning("alpha_code", "alpha", SemanticDomain.SPECIES),
+            make_meaning("omega_code", "omega", SemanticDomain.TEMPORAL),
+        ]
+
+        relationships = StrongRuleGrouper()._calculate_semantic_relationships(meanings)
+        assert [(r.field1, r.field2) for r in relationships] == [("alpha_code", "omega_code")]
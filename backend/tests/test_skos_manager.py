@@ -0,0 +1,37 @@
+"""
+Tests for SKOS manager lookups
+"""
+import pytest
+from backend.app.services.skos_manager import SKOSManagerImpl
+
+
+class TestSKOSManagerLookups:
+    """Test memoized version lookups"""
+
+    @pytest.fixture
+    def skos_manager(self):
+        """Create a SKOS manager for testing"""
+        return SKOSManagerImpl("data/euring_versions")
+
+    @pytest.mark.asyncio
+    async def test_conversion_rules_are_independent_copies(self, skos_manager):
+        """Changing returned conversion rules does not affect later calls"""
+        first = await skos_manager.get_conversion_rules("euring_1966", "euring_1979")
+        expected = first.model_dump()
+        first.field_mappings[0]["target_field"] = "changed"
+        first.field_mappings.clear()
+        first.transformation_functions.append("changed")
+
+        second = await skos_manager.get_conversion_rules("euring_1966", "euring_1979")
+        assert second.model_dump() == expected
+
+    @pytest.mark.asyncio
+    async def test_version_characteristics_are_independent_copies(self, skos_manager):
+        """Changing returned version characteristics does not affect later calls"""
+        first = await skos_manager.get_version_characteristics("euring_2000")
+        expected = first.model_dump()
+        first.unique_patterns.append("changed")
+        first.validation_rules.clear()
+
+        second = await skos_manager.get_version_characteristics("euring_2000")
+        assert second.model_dump() == expected
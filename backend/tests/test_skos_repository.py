@@ -0,0 +1,146 @@
+"""
+Tests for SKOS repository persistence of appended relationships and mappings
+"""
+import json
+import os
+import stat
+import pytest
+from backend.app.repositories.skos_repository import SKOSRepository
+from backend.app.models.euring_models import (
+    VersionRelationship, ConversionMapping, CompatibilityLevel
+)
+
+
+def make_relationship(from_version: str, to_version: str) -> VersionRelationship:
+    return VersionRelationship(
+        from_version=from_version,
+        to_version=to_version,
+        relationship_type="successor",
+        description=f"{to_version} follows {from_version}"
+    )
+
+
+def make_mapping(from_version: str, to_version: str) -> ConversionMapping:
+    return ConversionMapping(
+        from_version=from_version,
+        to_version=to_version,
+        field_mappings=[],
+        transformation_rules=[],
+        compatibility_level=CompatibilityLevel.PARTIAL
+    )
+
+
+class TestSKOSRepository:
+    """Test the saved list plus append-only delta storage format"""
+
+    @pytest.fixture
+    def repository(self, tmp_path):
+        """Create a repository over an empty data directory"""
+        return SKOSRepository(str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_relationship_round_trip(self, repository):
+        """Appended relationships load, survive compaction, save and reload"""
+        relationships_file = repository.data_directory / "relationships.json"
+        delta_file = repository.data_directory / "relationships.delta.jsonl"
+
+        await repository.append_relationship(make_relationship("euring_1966", "euring_1979"))
+        await repository.append_relationship(make_relationship("euring_1979", "euring_2000"))
+        assert delta_file.exists()
+
+        loaded = await repository.load_relationships()
+        assert [r.to_version for r in loaded] == ["euring_1979", "euring_2000"]
+
+        # Loading only reads
+        assert delta_file.exists()
+        assert not relationships_file.exists()
+
+        await repository.compact()
+        assert not delta_file.exists()
+        assert len(json.loads(relationships_file.read_text(encoding="utf-8"))) == 2
+        assert await repository.load_relationships() == loaded
+
+        await repository.append_relationship(make_relationship("euring_2000", "euring_2020"))
+        loaded = await repository.load_relationships()
+        assert [r.to_version for r in loaded] == ["euring_1979", "euring_2000", "euring_2020"]
+
+        await repository.save_relationships(loaded[:1])
+        assert not delta_file.exists()
+        assert await repository.load_relationships() == loaded[:1]
+
+    @pytest.mark.asyncio
+    async def test_conversion_mapping_round_trip(self, repository):
+        """Appended conversion mappings load alongside the saved list"""
+        await repository.save_conversion_mappings([make_mapping("euring_1966", "euring_2000")])
+        await repository.append_conversion_mapping(make_mapping("euring_2000", "euring_2020"))
+
+        loaded = await repository.load_conversion_mappings()
+        assert [(m.from_version, m.to_version) for m in loaded] == [
+            ("euring_1966", "euring_2000"),
+            ("euring_2000", "euring_2020"),
+        ]
+        await repository.compact()
+        assert not (repository.data_directory / "conversion_mappings.delta.jsonl").exists()
+        assert await repository.load_conversion_mappings() == loaded
+
+    @pytest.mark.asyncio
+    async def test_append_compacts_large_delta(self, repository):
+        """Appending folds the delta into the list once it grows past the limit"""
+        repository.delta_compact_bytes = 1
+        await repository.append_relationship(make_relationship("euring_1966", "euring_1979"))
+
+        assert not (repository.data_directory / "relationships.delta.jsonl").exists()
+        assert [r.to_version for r in await repository.load_relationships()] == ["euring_1979"]
+
+    @pytest.mark.asyncio
+    async def test_leftover_delta_is_not_loaded_twice(self, repository):
+        """A delta left behind by an interrupted save does not repeat its records"""
+        delta_file = repository.data_directory / "relationships.delta.jsonl"
+
+        await repository.append_relationship(make_relationship("euring_1966", "euring_1979"))
+        leftover = delta_file.read_text(encoding="utf-8")
+
+        loaded = await repository.load_relationships()
+        await repository.save_relationships(loaded)
+
+        # Simulate a crash between replacing the list and removing the delta
+        delta_file.write_text(leftover, encoding="utf-8")
+        assert await repository.load_relationships() == loaded
+
+        # Appending after that starts a fresh delta instead of extending the stale one
+        await repository.append_relationship(make_relationship("euring_1979", "euring_2000"))
+        loaded = await repository.load_relationships()
+        assert [r.to_version for r in loaded] == ["euring_1979", "euring_2000"]
+
+    @pytest.mark.asyncio
+    async def test_delta_survives_list_edited_in_place(self, repository):
+        """Records appended before the list was edited by hand are not dropped"""
+        relationships_file = repository.data_directory / "relationships.json"
+
+        await repository.save_relationships([make_relationship("euring_1966", "euring_1979")])
+        await repository.append_relationship(make_relationship("euring_1979", "euring_2000"))
+
+        edited = json.loads(relationships_file.read_text(encoding="utf-8"))
+        edited[0]["description"] = "edited"
+        relationships_file.write_text(json.dumps(edited, indent=4), encoding="utf-8")
+
+        loaded = await repository.load_relationships()
+        assert [(r.to_version, r.description) for r in loaded] == [
+            ("euring_1979", "edited"),
+            ("euring_2000", "euring_2000 follows euring_1979"),
+        ]
+
+        await repository.append_relationship(make_relationship("euring_2000", "euring_2020"))
+        loaded = await repository.load_relationships()
+        assert [r.to_version for r in loaded] == ["euring_1979", "euring_2000", "euring_2020"]
+
+    @pytest.mark.asyncio
+    async def test_rewrite_keeps_file_permissions(self, repository):
+        """Replacing a saved list keeps the permissions it had"""
+        relationships_file = repository.data_directory / "relationships.json"
+        await repository.save_relationships([make_relationship("euring_1966", "euring_1979")])
+        os.chmod(relationships_file, 0o664)
+
+        await repository.save_relationships([make_relationship("euring_1979", "euring_2000")])
+
+        assert stat.S_IMODE(relationships_file.stat().st_mode) == 0o664